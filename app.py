@@ -1,5 +1,15 @@
 import streamlit as st
 from core.smanager import StateManager
+from core.generator import Generator
+from core.profiling import enable_profile_logging, log_profile
+from core.warmup import warm_up
+
+
+@st.cache_resource(show_spinner=False)
+def warm_render_stack():
+    """Runs once per server process so the first PDF render is not a cold one."""
+    return warm_up()
+
 
 p0 = st.Page("pages/home.py", title="Home", icon=":material/home:")
 p1 = st.Page("pages/p1.py", title="Personal Information", icon=":material/person:")
@@ -10,4 +20,7 @@ p5 = st.Page("pages/p5.py", title="Finalize & Download", icon=":material/downloa
 
 pg = st.navigation([p0, p1, p2, p3, p4, p5])
 StateManager.initialize()
+enable_profile_logging()
+Generator.add_profile_hook(log_profile)
+warm_render_stack()
 pg.run()
\ No newline at end of file
@@ -0,0 +1,64 @@
+"""Suggestion analysis cost with and without the per-text analysis cache.
+
+Run from the repository root:
+    python -m benchmarks.bench_analysis --entries 6 --runs 50
+
+Runs every ``SuggestionEngine`` entry point on one resume three ways: with
+an empty cache, again unchanged, and after editing a single bullet, then
+lists the cost of each suggestion rule over all runs.
+"""
+
+import argparse
+import copy
+import statistics
+import time
+from benchmarks.sample_data import make_resume
+from core.analysis import TextAnalyzer
+from core.rules import RuleEngine
+from core.suggestions import SuggestionEngine
+
+
+def analyze_all(resume):
+    SuggestionEngine.analyze_personal_info(resume)
+    SuggestionEngine.analyze_experience(resume["experience"])
+    SuggestionEngine.analyze_projects(resume["projects"])
+    SuggestionEngine.analyze_overall_resume(resume)
+
+
+def median_ms(fn, runs, setup=lambda: None):
+    timings = []
+    for _ in range(runs):
+        setup()
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--entries", type=int, default=6)
+    parser.add_argument("--runs", type=int, default=50)
+    args = parser.parse_args()
+
+    resume = make_resume(args.entries)
+    edited = copy.deepcopy(resume)
+    edited["experience"][0]["highlights"] += "\nShipped one more thing"
+
+    cold = median_ms(lambda: analyze_all(resume), args.runs, setup=TextAnalyzer.cache.clear)
+    warm = median_ms(lambda: analyze_all(resume), args.runs)
+
+    def prime():
+        TextAnalyzer.cache.clear()
+        analyze_all(resume)
+
+    edit = median_ms(lambda: analyze_all(edited), args.runs, setup=prime)
+    print(f"{args.entries} entries, median of {args.runs} runs")
+    print(f"cold {cold:.3f} ms  unchanged {warm:.3f} ms  one bullet edited {edit:.3f} ms")
+    print(f"\n{'rule':<36} {'calls':>7} {'findings':>9} {'total ms':>9} {'mean us':>8}")
+    for row in RuleEngine.rule_stats():
+        print(f"{row['rule']:<36} {row['calls']:7d} {row['findings']:9d} {row['total_ms']:9.2f} {row['mean_us']:8.1f}")
+
+
+if __name__ == "__main__":
+    main()
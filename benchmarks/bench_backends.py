@@ -0,0 +1,86 @@
+"""Compare the reportlab, in-process Typst and rendercv subprocess backends.
+
+Run from the repository root:
+    python -m benchmarks.bench_backends --runs 20
+
+The rendercv path is skipped when the ``rendercv`` CLI is not on PATH.
+"""
+
+import argparse
+import os
+import shutil
+import statistics
+import subprocess
+import tempfile
+import time
+import yaml
+from benchmarks.sample_data import make_resume
+from core.generator import Generator
+from core.typst_backend import TypstGenerator
+
+
+def render_reportlab(resume):
+    Generator.section_cache.clear()
+    return Generator.generate_pdf(resume, use_cache=False)
+
+
+def render_typst(resume):
+    return TypstGenerator.generate_pdf(resume)
+
+
+def render_rendercv_subprocess(resume):
+    # Mirrors guide.generate_resume: dump YAML, shell out, read the PDF back
+    from guide import create_rendercv_yaml
+
+    with tempfile.TemporaryDirectory() as workdir:
+        yaml_path = os.path.join(workdir, "resume.yaml")
+        with open(yaml_path, "w") as f:
+            yaml.dump(create_rendercv_yaml(resume), f, default_flow_style=False, sort_keys=False)
+        result = subprocess.run(
+            ["rendercv", "render", yaml_path], capture_output=True, text=True, cwd=workdir
+        )
+        for root, _, files in os.walk(workdir):
+            for name in files:
+                if name.endswith(".pdf"):
+                    with open(os.path.join(root, name), "rb") as f:
+                        return f.read(), None
+        return None, result.stderr or result.stdout or "rendercv produced no PDF"
+
+
+def measure(render, resume, runs):
+    first_start = time.perf_counter()
+    pdf_bytes, error = render(resume)
+    first = time.perf_counter() - first_start
+    if error or not pdf_bytes:
+        raise SystemExit(f"{render.__name__} failed: {error}")
+
+    timings = []
+    for i in range(runs):
+        resume["summary"] = f"Engineer with {i}+ years of experience shipping software."
+        start = time.perf_counter()
+        render(resume)
+        timings.append(time.perf_counter() - start)
+    return first * 1000, statistics.median(timings) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--entries", type=int, default=5)
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+
+    backends = [("reportlab Generator", render_reportlab), ("Typst (in-process)", render_typst)]
+    if shutil.which("rendercv"):
+        backends.append(("rendercv subprocess", render_rendercv_subprocess))
+    else:
+        print("rendercv CLI not found; skipping the subprocess backend")
+
+    print(f"{args.entries} experience entries, {args.runs} runs")
+    print(f"{'backend':<22}{'first (ms)':>12}{'median (ms)':>14}")
+    for name, render in backends:
+        first, median = measure(render, make_resume(args.entries), args.runs)
+        print(f"{name:<22}{first:>12.2f}{median:>14.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""Render-time scaling benchmark for long, multi-page resumes.
+
+Run from the repository root:
+    python -m benchmarks.bench_layout --runs 5
+    python -m benchmarks.bench_layout --entries 1 50 200
+    python -m benchmarks.bench_layout --entries 5 10 15 --fit-pages 1
+
+Reports the median full render time for each experience entry count, the
+page count, and the time per entry, which should stay roughly flat if
+layout cost grows linearly with the document. With ``--fit-pages`` it also
+times auto-fit against the same content and reports the ratio to one render.
+"""
+
+import argparse
+import statistics
+import time
+import pypdfium2 as pdfium
+from benchmarks.sample_data import make_resume
+from core.generator import Generator
+
+DEFAULT_ENTRIES = (1, 5, 10, 25, 50, 100, 200)
+
+
+def time_render(resume, runs, fit_pages=None):
+    timings = []
+    for _ in range(runs):
+        Generator.section_cache.clear()
+        Generator.measure_cache.clear()
+        start = time.perf_counter()
+        pdf_bytes, error = Generator.generate_pdf(resume, use_cache=False, fit_pages=fit_pages)
+        timings.append(time.perf_counter() - start)
+        if error:
+            raise SystemExit(f"Render failed: {error}")
+    return statistics.median(timings) * 1000, len(pdfium.PdfDocument(pdf_bytes))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--entries", type=int, nargs="+", default=DEFAULT_ENTRIES)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--fit-pages", type=int, default=None)
+    args = parser.parse_args()
+
+    # Warm imports and compile every theme scale auto-fit may use
+    Generator.generate_pdf(make_resume(1), use_cache=False)
+    Generator.generate_pdf(make_resume(50), use_cache=False, fit_pages=1)
+
+    columns = f"{'entries':>7} {'pages':>5} {'median ms':>10} {'ms/entry':>9}"
+    if args.fit_pages:
+        columns += f" {'fit pages':>9} {'fit ms':>8} {'ratio':>6}"
+    print(columns)
+    for entries in args.entries:
+        resume = make_resume(entries)
+        median_ms, pages = time_render(resume, args.runs)
+        row = f"{entries:7d} {pages:5d} {median_ms:10.1f} {median_ms / entries:9.2f}"
+        if args.fit_pages:
+            fit_ms, fit_pages = time_render(resume, args.runs, args.fit_pages)
+            row += f" {fit_pages:9d} {fit_ms:8.1f} {fit_ms / median_ms:6.2f}"
+        print(row)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""Loading and analysis cost with large external lexicons.
+
+Run from the repository root:
+    python -m benchmarks.bench_lexicon --terms 1000 10000 50000
+
+Writes a synthetic YAML lexicon per size, then reports the one-off load
+time (parse, hash indexes, matcher compile) and the per-resume cost of the
+experience and overall analysis, next to the list-based lookups the
+suggestion engine used to do.
+"""
+
+import argparse
+import os
+import statistics
+import tempfile
+import time
+import yaml
+from benchmarks.sample_data import make_resume
+from core.analysis import TextAnalyzer
+from core.lexicon import LexiconRegistry
+from core.suggestions import SuggestionEngine
+
+
+def write_lexicon(path, terms):
+    per_section = max(1, terms // 3)
+    lexicon = {
+        "action_verbs": {
+            f"category{c}": [f"Verbed{c}x{i}" for i in range(per_section // 10)] for c in range(10)
+        },
+        "weak_words": [f"weak phrase {i}" for i in range(per_section)],
+        "industry_keywords": {
+            f"industry{c}": [f"skill{c} {i}" for i in range(per_section // 10)] for c in range(10)
+        },
+    }
+    lexicon["action_verbs"]["category0"] += ["Led", "Developed", "Improved", "Built"]
+    with open(path, "w", encoding="utf-8") as f:
+        yaml.safe_dump(lexicon, f)
+
+
+def list_lookups(resume, lexicon):
+    # The previous approach: flatten to a list and scan it per word and per phrase
+    all_verbs = [v for verbs in lexicon.action_verbs.values() for v in verbs]
+    text = str(resume)
+    for exp in resume["experience"]:
+        for bullet in exp["highlights"].split("\n"):
+            _ = bullet.split()[0] in all_verbs
+            _ = any(weak in bullet.lower() for weak in lexicon.weak_words)
+    return sum(1 for verb in all_verbs if verb.lower() in text.lower())
+
+
+def median_ms(fn, runs, setup=lambda: None):
+    timings = []
+    for _ in range(runs):
+        setup()
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--terms", type=int, nargs="+", default=(1000, 10000, 50000))
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+
+    resume = make_resume(6)
+    print(f"{'terms':>6} {'load ms':>9} {'analysis ms':>12} {'list-based ms':>14}")
+    with tempfile.TemporaryDirectory() as workdir:
+        for terms in args.terms:
+            path = os.path.join(workdir, f"lexicon_{terms}.yaml")
+            write_lexicon(path, terms)
+
+            start = time.perf_counter()
+            lexicon = LexiconRegistry.get(path)
+            lexicon.matcher.pattern  # Compiled lazily; include it in the load cost
+            load_ms = (time.perf_counter() - start) * 1000
+
+            LexiconRegistry.set_default(path)
+            # Cleared before each run so cached per-text analyses don't hide the lexicon's cost
+            analysis = median_ms(lambda: (
+                SuggestionEngine.analyze_experience(resume["experience"]),
+                SuggestionEngine.analyze_overall_resume(resume),
+            ), args.runs, setup=TextAnalyzer.cache.clear)
+            LexiconRegistry.set_default(None)
+            baseline = median_ms(lambda: list_lookups(resume, lexicon), args.runs)
+            print(f"{terms:6d} {load_ms:9.1f} {analysis:12.3f} {baseline:14.3f}")
+
+
+if __name__ == "__main__":
+    main()
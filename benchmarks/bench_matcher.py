@@ -0,0 +1,63 @@
+"""Lexicon scan cost: per-term substring checks versus the compiled matcher.
+
+Run from the repository root:
+    python -m benchmarks.bench_matcher --runs 200
+
+The built-in lexicon is padded with synthetic terms to show how each
+approach scales with lexicon size on the same resume text.
+"""
+
+import argparse
+import statistics
+import time
+from benchmarks.sample_data import make_resume
+from core.data import ACTION_VERBS, INDUSTRY_KEYWORDS, WEAK_WORDS
+from core.matcher import PhraseMatcher
+
+LEXICON_SIZES = (1, 10, 100)
+
+
+def resume_text(entries):
+    resume = make_resume(entries)
+    parts = [resume["summary"]] + [exp["highlights"] for exp in resume["experience"]]
+    return "\n".join(parts)
+
+
+def padded_terms(factor):
+    terms = [v for verbs in ACTION_VERBS.values() for v in verbs] + WEAK_WORDS
+    terms += [k for keywords in INDUSTRY_KEYWORDS.values() for k in keywords]
+    return terms + [f"{term}{i}" for i in range(1, factor) for term in terms]
+
+
+def naive(text, terms):
+    return [term for term in terms if term.lower() in text.lower()]
+
+
+def median_ms(fn, runs):
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=200)
+    parser.add_argument("--entries", type=int, default=6)
+    args = parser.parse_args()
+
+    text = resume_text(args.entries)
+    print(f"{len(text)} characters, median of {args.runs} scans")
+    print(f"{'terms':>6} {'substring ms':>13} {'matcher ms':>11}")
+    for factor in LEXICON_SIZES:
+        terms = padded_terms(factor)
+        matcher = PhraseMatcher({"terms": terms})
+        substring = median_ms(lambda: naive(text, terms), args.runs)
+        compiled = median_ms(lambda: matcher.findall(text), args.runs)
+        print(f"{len(terms):6d} {substring:13.3f} {compiled:11.3f}")
+
+
+if __name__ == "__main__":
+    main()
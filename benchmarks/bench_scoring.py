@@ -0,0 +1,56 @@
+"""Overall scoring throughput: per-record engine calls versus core.scoring.
+
+Run from the repository root:
+    python -m benchmarks.bench_scoring --records 1000 10000 50000
+
+Records are built from the sample resume with every bullet made unique, so
+the per-text analysis cache does not flatter the per-record loop.
+"""
+
+import argparse
+import random
+import time
+from benchmarks.sample_data import HIGHLIGHTS, make_resume
+from core.analysis import TextAnalyzer
+from core.scoring import score_records
+from core.suggestions import SuggestionEngine
+
+WORDS = ("billing", "search", "mobile", "payments", "platform", "analytics", "infra", "growth")
+
+
+def make_records(count, seed=0):
+    rng = random.Random(seed)
+    bullets = HIGHLIGHTS.split("\n")
+    records = []
+    for i in range(count):
+        resume = make_resume(rng.randint(1, 4))
+        for exp in resume["experience"]:
+            exp["highlights"] = "\n".join(
+                f"{bullet} for the {rng.choice(WORDS)} team #{i}" for bullet in rng.sample(bullets, 3)
+            )
+        records.append((f"record_{i:07d}", resume))
+    return records
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--records", type=int, nargs="+", default=(1000, 10000, 50000))
+    args = parser.parse_args()
+
+    print(f"{'records':>8} {'loop s':>8} {'vectorized s':>13} {'speedup':>8}")
+    for count in args.records:
+        records = make_records(count)
+        TextAnalyzer.cache.clear()
+        start = time.perf_counter()
+        expected = [SuggestionEngine.analyze_overall_resume(data)[0] for _, data in records]
+        loop = time.perf_counter() - start
+
+        start = time.perf_counter()
+        scores = score_records(records)
+        vectorized = time.perf_counter() - start
+        assert scores["score"].tolist() == expected, "vectorized scores differ from the engine"
+        print(f"{count:8d} {loop:8.2f} {vectorized:13.2f} {loop / vectorized:7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
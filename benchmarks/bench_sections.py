@@ -0,0 +1,47 @@
+"""Edit-one-field render benchmark for the section flowable cache.
+
+Run from the repository root:
+    python -m benchmarks.bench_sections --entries 6 --runs 30
+"""
+
+import argparse
+import statistics
+import time
+from benchmarks.sample_data import make_resume
+from core.generator import Generator
+
+
+def time_renders(resume, runs, warm_sections):
+    timings = []
+    for i in range(runs):
+        # Simulate the user editing a single bullet between renders
+        resume["experience"][0]["highlights"] = f"Shipped release {i} to 100% of users"
+        if not warm_sections:
+            Generator.section_cache.clear()
+        start = time.perf_counter()
+        _, error = Generator.generate_pdf(resume, use_cache=False)
+        timings.append(time.perf_counter() - start)
+        if error:
+            raise SystemExit(f"Render failed: {error}")
+    return statistics.median(timings) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--entries", type=int, default=6)
+    parser.add_argument("--runs", type=int, default=30)
+    args = parser.parse_args()
+
+    resume = make_resume(args.entries)
+    Generator.generate_pdf(resume, use_cache=False)  # Warm imports and themes
+
+    cold = time_renders(resume, args.runs, warm_sections=False)
+    warm = time_renders(resume, args.runs, warm_sections=True)
+    print(f"{args.entries} experience entries, median of {args.runs} renders")
+    print(f"  full rebuild:          {cold:7.2f} ms")
+    print(f"  cached sections:       {warm:7.2f} ms")
+    print(f"  reduction:             {(1 - warm / cold) * 100:6.1f} %")
+
+
+if __name__ == "__main__":
+    main()
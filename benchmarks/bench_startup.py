@@ -0,0 +1,82 @@
+"""Time-to-first-PDF for a cold worker versus one forked from a warmed parent.
+
+Run from the repository root:
+    python -m benchmarks.bench_startup --runs 5
+
+``cold process`` starts a fresh interpreter that imports the generator and
+renders once, as a freshly deployed server does on its first request.
+``spawned worker`` is the first render in a new pool worker started with
+``spawn``. ``forked from warm`` is the first render in a worker from
+``core.warmup.warm_pool``, which is what the service and batch CLI use.
+"""
+
+import argparse
+import multiprocessing
+import statistics
+import subprocess
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from benchmarks.sample_data import make_resume
+
+COLD_SCRIPT = """
+import time
+start = time.perf_counter()
+from benchmarks.sample_data import make_resume
+from core.generator import Generator
+Generator.generate_pdf(make_resume(4), use_cache=False)
+print(time.perf_counter() - start)
+"""
+
+
+def render_once(resume):
+    from core.generator import Generator
+    _, error = Generator.generate_pdf(resume, use_cache=False)
+    return error
+
+
+def first_render(pool, resume):
+    start = time.perf_counter()
+    error = pool.submit(render_once, resume).result()
+    if error:
+        raise SystemExit(f"Render failed: {error}")
+    return time.perf_counter() - start
+
+
+def time_cold_process():
+    output = subprocess.run(
+        [sys.executable, "-c", COLD_SCRIPT], capture_output=True, text=True, check=True
+    ).stdout
+    return float(output.strip())
+
+
+def time_spawned_worker(resume):
+    # Create the pool outside the timing so only the first request is measured
+    with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as pool:
+        return first_render(pool, resume)
+
+
+def time_forked_worker(resume):
+    from core.warmup import warm_pool
+    with warm_pool(1) as pool:
+        return first_render(pool, resume)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    resume = make_resume(4)
+    results = {
+        "cold process": [time_cold_process() for _ in range(args.runs)],
+        "spawned worker": [time_spawned_worker(resume) for _ in range(args.runs)],
+        "forked from warm": [time_forked_worker(resume) for _ in range(args.runs)],
+    }
+    print(f"Time to first PDF, median of {args.runs}")
+    for label, timings in results.items():
+        print(f"  {label:<18} {statistics.median(timings) * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
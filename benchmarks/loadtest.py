@@ -0,0 +1,99 @@
+"""Load test for the HTTP render service on localhost.
+
+Start the service, then run from the repository root:
+    python -m core.service --port 8600 --workers 4
+    python -m benchmarks.loadtest --url http://127.0.0.1:8600 --clients 16 --requests 400
+
+Each client thread reuses one keep-alive connection. ``--unique`` sets the
+share of requests with a distinct payload; the rest repeat a small set of
+resumes so concurrent duplicates exercise request coalescing.
+"""
+
+import argparse
+import random
+import statistics
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+import requests
+from benchmarks.sample_data import make_resume
+
+SHARED_PAYLOADS = 4
+
+
+def percentile(sorted_values, pct):
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, round(pct / 100 * (len(sorted_values) - 1)))
+    return sorted_values[index]
+
+
+def build_payloads(count, unique, entries, seed=0):
+    rng = random.Random(seed)
+    shared = [make_resume(entries) for _ in range(SHARED_PAYLOADS)]
+    for i, resume in enumerate(shared):
+        resume["name"] = f"Shared Candidate {i}"
+    payloads = []
+    for i in range(count):
+        if rng.random() < unique:
+            resume = make_resume(entries)
+            resume["name"] = f"Candidate {i}"
+            payloads.append(resume)
+        else:
+            payloads.append(rng.choice(shared))
+    return payloads
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--url", default="http://127.0.0.1:8600")
+    parser.add_argument("--endpoint", default="render", choices=("render", "validate", "score"))
+    parser.add_argument("--clients", type=int, default=16)
+    parser.add_argument("--requests", type=int, default=400)
+    parser.add_argument("--unique", type=float, default=0.5, help="Share of distinct payloads (0-1)")
+    parser.add_argument("--entries", type=int, default=4, help="Experience entries per resume")
+    args = parser.parse_args()
+
+    base_url = args.url.rstrip("/")
+    url = f"{base_url}/{args.endpoint}"
+    payloads = build_payloads(args.requests, args.unique, args.entries)
+    sessions = threading.local()
+    statuses = Counter()
+    latencies = []
+    lock = threading.Lock()
+
+    def send(payload):
+        if not hasattr(sessions, "session"):
+            sessions.session = requests.Session()
+        start = time.perf_counter()
+        try:
+            status = sessions.session.post(url, json=payload, timeout=60).status_code
+        except requests.RequestException as e:
+            status = type(e).__name__
+        elapsed = time.perf_counter() - start
+        with lock:
+            statuses[status] += 1
+            latencies.append(elapsed)
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.clients) as clients:
+        list(clients.map(send, payloads))
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    print(f"{args.requests} requests to {url} from {args.clients} clients in {elapsed:.2f}s")
+    print(f"  throughput: {args.requests / elapsed:8.1f} req/s")
+    print(f"  latency:    p50={percentile(latencies, 50) * 1000:.1f}ms "
+          f"p95={percentile(latencies, 95) * 1000:.1f}ms "
+          f"mean={statistics.fmean(latencies) * 1000:.1f}ms")
+    print(f"  statuses:   {dict(sorted(statuses.items(), key=str))}")
+    try:
+        health = requests.get(f"{base_url}/health", timeout=5).json()
+        print(f"  server:     {health}")
+    except requests.RequestException:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+import copy
+
+BASE_RESUME = {
+    "name": "Jordan Example",
+    "title": "Senior Software Engineer",
+    "email": "jordan@example.com",
+    "phone": "+1 555 010 2030",
+    "location": "Austin, TX",
+    "summary": (
+        "Backend engineer with 8+ years building distributed systems. Led platform "
+        "migrations that cut infrastructure cost by 30% and improved p95 latency 2x."
+    ),
+    "education": [
+        {
+            "institution": "University of Texas",
+            "degree": "BSc Computer Science",
+            "field": "Computer Science",
+            "start_date": "2010-09-01",
+            "end_date": "2014-05-01",
+            "gpa": "3.8",
+            "highlights": "Dean's List\nACM chapter chair",
+        }
+    ],
+    "projects": [
+        {
+            "name": "Open source CLI",
+            "date": "2021-06-01",
+            "url": "github.com/example/cli",
+            "description": "Built a Python CLI for ETL pipelines with docker packaging",
+        }
+    ],
+    "custom_sections": [
+        {"title": "Certifications", "content": "AWS Solutions Architect\nCKA"},
+    ],
+}
+
+HIGHLIGHTS = (
+    "Led a team of 5 engineers delivering a payments platform\n"
+    "Responsible for deployment pipelines across 3 regions\n"
+    "Improved throughput by 40% by reworking the caching layer\n"
+    "Developed microservices using docker and kubernetes"
+)
+
+
+def make_resume(experience_entries=3):
+    """Returns a realistic resume with the given number of experience entries."""
+    resume = copy.deepcopy(BASE_RESUME)
+    resume["experience"] = [
+        {
+            "company": f"Company {i}",
+            "position": "Software Engineer",
+            "location": "Remote",
+            "start_date": f"{2000 + i % 20}-01-01",
+            "end_date": f"{2001 + i % 20}-01-01",
+            "highlights": HIGHLIGHTS,
+        }
+        for i in range(experience_entries)
+    ]
+    return resume
@@ -0,0 +1,158 @@
+import re
+from array import array
+from bisect import bisect_left
+from dataclasses import dataclass
+from typing import Iterator, NamedTuple, Optional, Tuple
+from core.cache import LRUCache
+from core.lexicon import LexiconRegistry
+from core.matcher import Match
+
+METRIC_PATTERN = re.compile(r"\$\d+|\d+[%x+]")
+DIGIT_PATTERN = re.compile(r"\d")
+TOKEN_PATTERN = re.compile(r"\S+")
+BULLET_PATTERN = re.compile(r"\S(?:[^\n]*\S)?")                  # a line without its outer whitespace
+FIRST_PERSON_PATTERN = re.compile(r"I |my |me ")
+
+# User-authored prose per section; contact details, URLs and dates are left out
+TEXT_FIELDS = {
+    "personal": ("title", "label", "summary"),
+    "experience": ("position", "highlights"),
+    "education": ("degree", "field", "highlights"),
+    "projects": ("name", "description"),
+    "skills": ("items",),
+    "custom_sections": ("title", "content"),
+}
+
+
+class TextField(NamedTuple):
+    section: str
+    entry: Optional[int]  # index within the section, None for personal fields
+    field: str
+    text: str
+
+
+def iter_text_fields(form_data: dict, lines: bool = True) -> Iterator[TextField]:
+    """Yields each non-empty line of the resume's user-authored text fields.
+
+    Lines are tagged with their section, entry and field so scoring rules can
+    tell a bullet from a summary without scanning the whole dict's repr.
+    With ``lines=False`` each field is yielded whole, for callers that split
+    it themselves.
+    """
+    for section, fields in TEXT_FIELDS.items():
+        if section == "personal":
+            entries = [(None, form_data)]
+        else:
+            entries = enumerate(form_data.get(section) or ())
+        for entry, values in entries:
+            if not isinstance(values, dict):
+                continue  # Malformed entry, e.g. a section given as a plain string
+            for field in fields:
+                value = values.get(field)
+                if not isinstance(value, str):
+                    continue
+                if not lines:
+                    if value.strip():
+                        yield TextField(section, entry, field, value)
+                    continue
+                for line in value.split("\n"):
+                    line = line.strip()
+                    if line:
+                        yield TextField(section, entry, field, line)
+
+
+@dataclass(frozen=True, slots=True)
+class TextDocument:
+    """One text tokenized and split into bullets once.
+
+    Tokens and bullets (non-empty lines, stripped) are kept as ``array``
+    offset pairs into ``text`` instead of lists of substrings, and every
+    suggestion rule reads its counts and lexicon matches from here.
+    """
+
+    text: str
+    token_starts: array
+    token_ends: array
+    bullet_starts: array
+    bullet_ends: array
+    verb_bullets: int      # bullets whose first word is an action verb
+    number_bullets: int    # bullets containing a digit
+    metric_count: int
+    first_person: Optional[Tuple[int, int]]  # span of the first "I"/"my"/"me", if any
+    verbs: Tuple[str, ...]
+    weak_phrases: Tuple[str, ...]
+    keywords: Tuple[str, ...]
+    matches: Tuple[Match, ...]
+
+    @property
+    def word_count(self) -> int:
+        return len(self.token_starts)
+
+    @property
+    def bullet_count(self) -> int:
+        return len(self.bullet_starts)
+
+    @property
+    def has_number(self) -> bool:
+        return self.number_bullets > 0
+
+
+class TextAnalyzer:
+    cache = LRUCache(max_entries=4096)
+
+    @staticmethod
+    def analyze(text: str) -> TextDocument:
+        """Returns the document for ``text``, building it once per content and lexicon.
+
+        Every ``SuggestionEngine`` rule reads from here, so a field is only
+        scanned again after it has been edited.
+        """
+        lexicon = LexiconRegistry.get()
+        key = (lexicon.version, text)
+        document = TextAnalyzer.cache.get(key)
+        if document is None:
+            document = TextAnalyzer._analyze(text, lexicon)
+            TextAnalyzer.cache.put(key, document)
+        return document
+
+    @staticmethod
+    def cache_stats():
+        return TextAnalyzer.cache.stats()
+
+    @staticmethod
+    def _analyze(text, lexicon) -> TextDocument:
+        token_starts, token_ends = _offsets(TOKEN_PATTERN, text)
+        bullet_starts, bullet_ends = _offsets(BULLET_PATTERN, text)
+
+        verb_bullets = 0
+        for start in bullet_starts:
+            end = token_ends[bisect_left(token_starts, start)]  # a bullet always begins a token
+            verb_bullets += text[start:end].rstrip(".,;:").casefold() in lexicon.verb_set
+
+        matches = lexicon.matcher.findall(text)
+        first_person = FIRST_PERSON_PATTERN.search(text)
+        return TextDocument(
+            text=text,
+            token_starts=token_starts,
+            token_ends=token_ends,
+            bullet_starts=bullet_starts,
+            bullet_ends=bullet_ends,
+            verb_bullets=verb_bullets,
+            number_bullets=sum(
+                DIGIT_PATTERN.search(text, start, end) is not None for start, end in zip(bullet_starts, bullet_ends)
+            ),
+            metric_count=len(METRIC_PATTERN.findall(text)),
+            first_person=(first_person.start(), first_person.end() - 1) if first_person else None,
+            verbs=tuple(lexicon.matcher.terms(matches, "verb")),
+            weak_phrases=tuple(lexicon.matcher.terms(matches, "weak")),
+            keywords=tuple(lexicon.matcher.terms(matches, "industry")),
+            matches=tuple(matches),
+        )
+
+
+def _offsets(pattern: re.Pattern, text: str) -> Tuple[array, array]:
+    starts, ends = array("I"), array("I")
+    for m in pattern.finditer(text):
+        starts.append(m.start())
+        ends.append(m.end())
+    return starts, ends
@@ -0,0 +1,188 @@
+"""Headless batch rendering of resume records.
+
+Usage:
+    python -m core.batch records.jsonl -o resumes/ --workers 8
+    python -m core.batch records.csv -o resumes/ --resume
+
+Records are streamed from a JSONL or CSV file (CSV cells holding lists such
+as ``experience`` are JSON-encoded), validated with ``ResumeValidator`` and
+rendered through ``Generator`` in a process pool. Every record gets a line in
+``manifest.jsonl`` inside the output directory; re-running with ``--resume``
+skips records that already have a manifest entry. Renders are deterministic,
+so the ``sha256`` recorded for each PDF can be used to find duplicates.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, wait
+from concurrent.futures.process import BrokenProcessPool
+from core.generator import Generator
+from core.records import iter_records
+from core.themes import DEFAULT_THEME, ThemeRegistry
+from core.typst_backend import TypstGenerator
+from core.validator import ResumeValidator
+from core.warmup import warm_pool
+
+MANIFEST_NAME = "manifest.jsonl"
+ENGINES = ("reportlab", "typst")
+
+
+def load_completed(manifest_path):
+    """Returns the ids of records that already have a manifest entry."""
+    if not os.path.exists(manifest_path):
+        return set()
+    completed = set()
+    with open(manifest_path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                completed.add(json.loads(line)["id"])
+            except (json.JSONDecodeError, KeyError):
+                continue  # Truncated line from an interrupted run
+    return completed
+
+
+def render_record(record_id, data, theme, output_dir, engine="reportlab"):
+    """Worker entry point: renders one record and writes it to disk."""
+    start = time.perf_counter()
+    if engine == "typst":
+        pdf_bytes, error = TypstGenerator.generate_pdf(data, theme=theme)
+    else:
+        pdf_bytes, error = Generator.generate_pdf(data, theme=theme, use_cache=False)
+    elapsed = time.perf_counter() - start
+    if error:
+        return {"id": record_id, "status": "error", "error": error, "render_s": elapsed}
+
+    pdf_path = os.path.join(output_dir, f"{record_id}.pdf")
+    with open(pdf_path, "wb") as f:
+        f.write(pdf_bytes)
+    return {
+        "id": record_id,
+        "status": "ok",
+        "path": pdf_path,
+        "sha256": hashlib.sha256(pdf_bytes).hexdigest(),
+        "render_s": elapsed,
+    }
+
+
+def percentile(sorted_values, pct):
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, round(pct / 100 * (len(sorted_values) - 1)))
+    return sorted_values[index]
+
+
+def run_batch(input_path, output_dir, workers=None, theme=DEFAULT_THEME, resume=False,
+              max_pending=None, engine="reportlab"):
+    """Renders every record in ``input_path`` and returns a throughput summary."""
+    os.makedirs(output_dir, exist_ok=True)
+    manifest_path = os.path.join(output_dir, MANIFEST_NAME)
+    completed = load_completed(manifest_path) if resume else set()
+    workers = workers or os.cpu_count() or 1
+    max_pending = max_pending or workers * 4
+
+    counts = {"ok": 0, "invalid": 0, "error": 0, "skipped": 0}
+    render_times = []
+    started = time.perf_counter()
+
+    with open(manifest_path, "a" if resume else "w", encoding="utf-8") as manifest:
+
+        def record(entry):
+            counts[entry["status"]] += 1
+            if "render_s" in entry:
+                render_times.append(entry["render_s"])
+            manifest.write(json.dumps(entry) + "\n")
+            manifest.flush()
+
+        def collect(future):
+            record_id = pending.pop(future)
+            try:
+                entry = future.result()
+            except Exception as e:  # A crashed worker fails its record, not the run
+                entry = {"id": record_id, "status": "error", "error": f"{type(e).__name__}: {e}"}
+            record(entry)
+
+        def reject(record_id, message):
+            if record_id in completed:
+                counts["skipped"] += 1
+            else:
+                record({"id": record_id, "status": "invalid", "errors": [message]})
+
+        pool = warm_pool(workers)
+        pending = {}  # future -> record id
+        try:
+            for record_id, data in iter_records(input_path, on_error=reject):
+                if record_id in completed:
+                    counts["skipped"] += 1
+                    continue
+
+                try:
+                    result = ResumeValidator.validate_resume(data)
+                except Exception as e:  # Wrong shapes, e.g. a string where a list of entries belongs
+                    reject(record_id, f"Malformed record: {type(e).__name__}: {e}")
+                    continue
+                if not result.is_valid:
+                    record({
+                        "id": record_id,
+                        "status": "invalid",
+                        "errors": [e.message for e in result.errors],
+                    })
+                    continue
+
+                # Bound the number of in-flight records so memory stays flat
+                if len(pending) >= max_pending:
+                    for future in wait(pending, return_when=FIRST_COMPLETED).done:
+                        collect(future)
+                try:
+                    future = pool.submit(render_record, record_id, data, theme, output_dir, engine)
+                except BrokenProcessPool:
+                    # A dead worker breaks the pool: in-flight records fail in collect, the rest get a new pool
+                    pool.shutdown(wait=False)
+                    pool = warm_pool(workers)
+                    future = pool.submit(render_record, record_id, data, theme, output_dir, engine)
+                pending[future] = record_id
+        finally:
+            # Records already submitted still get their manifest entries if reading fails
+            for future in wait(pending).done:
+                collect(future)
+            pool.shutdown()
+
+    elapsed = time.perf_counter() - started
+    render_times.sort()
+    processed = counts["ok"] + counts["invalid"] + counts["error"]
+    return {
+        **counts,
+        "elapsed_s": elapsed,
+        "records_per_s": processed / elapsed if elapsed else 0.0,
+        "p50_render_ms": percentile(render_times, 50) * 1000,
+        "p95_render_ms": percentile(render_times, 95) * 1000,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Render resume records to PDF in bulk.")
+    parser.add_argument("input", help="JSONL or CSV file with one resume record per line")
+    parser.add_argument("-o", "--output", default="resume_output", help="Output directory")
+    parser.add_argument("-w", "--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("--theme", default=DEFAULT_THEME, choices=ThemeRegistry.names())
+    parser.add_argument("--engine", default="reportlab", choices=ENGINES, help="Rendering backend")
+    parser.add_argument("--resume", action="store_true", help="Skip records already in the manifest")
+    args = parser.parse_args(argv)
+
+    summary = run_batch(
+        args.input, args.output, args.workers, args.theme, args.resume, engine=args.engine
+    )
+    print(
+        f"ok={summary['ok']} invalid={summary['invalid']} error={summary['error']} "
+        f"skipped={summary['skipped']} in {summary['elapsed_s']:.1f}s "
+        f"({summary['records_per_s']:.1f} records/s, "
+        f"p50={summary['p50_render_ms']:.1f}ms, p95={summary['p95_render_ms']:.1f}ms)"
+    )
+    return 0 if summary["error"] == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,237 @@
+from dataclasses import dataclass
+from typing import Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+PASS = "pass"
+INFO = "info"
+WARNING = "warning"
+FAIL = "fail"
+
+
+@dataclass(frozen=True, slots=True)
+class Finding:
+    """One result of a suggestion rule. Markdown is only built when rendered."""
+
+    rule: str
+    severity: str
+    section: str
+    entry: Optional[int] = None             # index within the section's entries
+    span: Optional[Tuple[int, int]] = None  # character offsets within the field text
+    params: Tuple = ()                      # values substituted into the rule's message
+
+    @property
+    def message(self) -> str:
+        return MESSAGES[self.rule].format(*self.params)
+
+    def as_dict(self) -> dict:
+        return {
+            "rule": self.rule,
+            "severity": self.severity,
+            "section": self.section,
+            "entry": self.entry,
+            "span": list(self.span) if self.span else None,
+            "params": list(self.params),
+        }
+
+
+MESSAGES = {
+    # Personal info
+    "summary.too_short": "Your summary is quite brief. Aim for 30-60 words to showcase your value",
+    "summary.too_long": "Your summary is a bit long. Try to condense it to 30-60 words for better impact",
+    "summary.weak_language": "Avoid passive phrases like '{0}' - use action-oriented language instead",
+    "summary.no_metrics": "Add numbers or metrics to quantify your experience (e.g., '5+ years', '20% improvement')",
+    "summary.first_person": "Write in third person or without pronouns (remove 'I', 'my', 'me')",
+    "title.too_vague": "Consider making your title more specific (e.g., 'Senior Software Engineer' instead of 'Engineer')",
+    # Education
+    "education.no_gpa": "Consider adding GPA if it's 3.5 or above",
+    "education.no_highlights": "Add relevant achievements, honors, or coursework",
+    "education.few_highlights": "Add more specific achievements (awards, projects, relevant coursework)",
+    # Experience
+    "experience.no_highlights": "Add key achievements and responsibilities",
+    "highlights.too_few": "Add more bullet points (aim for 3-5 key achievements)",
+    "highlights.too_many": "Consider condensing to 4-6 most impactful achievements",
+    "highlights.weak_verbs": "Start more bullets with strong action verbs (e.g., {0})",
+    "highlights.no_metrics": "Add metrics and numbers to quantify your impact (e.g., 'Increased efficiency by 30%')",
+    "highlights.weak_language": "Remove passive phrases like 'responsible for' - be direct and action-oriented",
+    # Projects
+    "project.no_description": "Add a description of the project and your contributions",
+    "project.short_description": "Expand description to include technologies used and impact",
+    "project.no_url": "Add a URL if the project is publicly available (GitHub, live demo, etc.)",
+    "project.no_skills": "Mention specific technologies or skills used",
+    # Overall
+    "completeness.contact_present": "Contact information present",
+    "completeness.contact_missing": "Missing contact information",
+    "completeness.summary_present": "Professional summary included",
+    "completeness.summary_missing": "Add a professional summary",
+    "completeness.education_present": "Education section filled",
+    "completeness.education_missing": "Add education details (optional)",
+    "completeness.experience_present": "Work experience included",
+    "completeness.experience_missing": "Add work experience",
+    "quality.bullets_strong": "Strong detail level ({0} achievement bullets)",
+    "quality.bullets_good": "Good detail, consider adding more achievements ({0} bullets)",
+    "quality.bullets_few": "Add more specific achievements and responsibilities",
+    "quality.metrics_excellent": "Excellent use of metrics ({0} quantified achievements)",
+    "quality.metrics_good": "Good metrics usage, add more numbers ({0} found)",
+    "quality.metrics_few": "Add metrics and numbers to quantify your impact",
+    "language.verbs_strong": "Strong use of action verbs",
+    "language.verbs_some": "Add more action verbs to strengthen impact",
+    "language.verbs_few": "Start bullets with action verbs (Led, Developed, Achieved, etc.)",
+    "language.no_weak": "No passive language detected",
+    "language.weak_found": "Remove {0} instances of passive phrases",
+}
+
+
+class Report(NamedTuple):
+    """Findings for one section (or ``"overall"``) plus what rendering them needs."""
+
+    section: str
+    findings: Tuple[Finding, ...]
+    entries: Sequence = ()  # entry dicts for per-entry headings
+    score: Optional[int] = None
+
+    def markdown(self) -> str:
+        if self.section == "overall":
+            return render_overall(self.score, self.findings)
+        return render_section(self.section, self.findings, self.entries)
+
+
+def diff_findings(previous: Iterable[Finding], current: Iterable[Finding]) -> Tuple[List[Finding], List[Finding]]:
+    """Returns the issues ``(added, resolved)`` between two analyses, ignoring passed checks.
+
+    Findings are matched on ``(rule, section, entry)``, so an issue whose
+    span or counts moved after an unrelated edit is not reported as new.
+    """
+    previous = {_identity(f): f for f in previous if f.severity != PASS}
+    current = {_identity(f): f for f in current if f.severity != PASS}
+    return (
+        [f for key, f in current.items() if key not in previous],
+        [f for key, f in previous.items() if key not in current],
+    )
+
+
+def _identity(finding: Finding) -> Tuple[str, str, Optional[int]]:
+    return finding.rule, finding.section, finding.entry
+
+
+EMPTY_SECTIONS = {
+    "education": """## :material/school: Education Section is Empty
+
+Education is optional, but adding it can strengthen your resume if:
+
+- You have relevant degrees or certifications
+- Your education is recent or from a prestigious institution
+- You're a recent graduate or entry-level candidate
+- The role requires specific educational qualifications
+
+**Tip:** For experienced professionals, work experience often matters more than education. You can skip this section if it's not relevant.
+""",
+    "experience": """## :material/work: Work Experience Missing
+
+Add work experience to showcase your professional background.
+
+**What to Include:**
+- Company name and position title
+- Employment dates
+- Key achievements and responsibilities
+- Quantifiable results and metrics
+""",
+    "projects": """## :material/rocket_launch: Projects Section is Optional
+
+Projects are optional but can strengthen your resume, especially for technical roles.
+
+**Consider adding projects if:**
+- You have notable side projects or open source contributions
+- You're a recent graduate or transitioning careers
+- You want to showcase specific technical skills
+- You have limited professional experience
+""",
+}
+
+SECTIONS_OK = {
+    "personal": """## :material/check_circle: Personal Info Looks Great!
+
+Your personal information section is well-structured.
+
+**General Tips:**
+- Keep your summary concise (2-3 sentences)
+- Highlight your unique value proposition
+- Include relevant keywords for your industry
+""",
+    "education": """## :material/check_circle: Education Section Looks Strong!
+
+Your education entries are well-detailed with good information.""",
+    "experience": """## :material/check_circle: Experience Section is Strong!
+
+Your work experience is well-documented with achievements.""",
+    "projects": """## :material/check_circle: Projects Section Looks Great!
+
+Your projects are well-documented with good descriptions.""",
+}
+
+OVERALL_GROUPS = (
+    ("completeness", "## :material/checklist: Resume Completeness\n"),
+    ("quality", "## :material/star: Content Quality\n"),
+    ("language", "## :material/edit: Language & Impact\n"),
+)
+
+SEVERITY_ICONS = {PASS: ":material/check:", WARNING: ":material/warning:", FAIL: ":material/close:"}
+
+
+def _heading(section, index, entry, first_rule):
+    if section == "personal":
+        if first_rule.startswith("title."):
+            return "## :material/work: Professional Title\n"
+        return "## :material/description: Professional Summary\n"
+    if section == "education":
+        return f"## :material/school: Education #{index+1}: {entry.get('degree', 'Entry')}\n"
+    if section == "projects":
+        return f"## :material/rocket_launch: Project #{index+1}: {entry.get('name', 'Entry')}\n"
+    if first_rule == "experience.no_highlights":
+        return f"## :material/work: Experience #{index+1}: {entry.get('position', 'Entry')}\n"
+    return f"## :material/work: {entry.get('position', 'Position')} at {entry.get('company', 'Company')}\n"
+
+
+def render_section(section: str, findings: Sequence[Finding], entries: Sequence = ()) -> str:
+    """Markdown for a section's findings, one heading per entry (or personal field)."""
+    if section in EMPTY_SECTIONS and not entries:
+        return EMPTY_SECTIONS[section]
+    if not findings:
+        return SECTIONS_OK[section]
+
+    lines = []
+    group = None
+    for finding in findings:
+        key = finding.rule.split(".")[0] if section == "personal" else finding.entry
+        if key != group:
+            if group is not None:
+                lines.append("")
+            group = key
+            entry = entries[finding.entry] if finding.entry is not None else None
+            lines.append(_heading(section, finding.entry, entry, finding.rule))
+        lines.append(f"- {finding.message}")
+    lines.append("")
+    return "\n".join(lines)
+
+
+def render_overall(score: int, findings: Sequence[Finding]) -> str:
+    """Markdown for the overall strength analysis: checklist per group, score and rating."""
+    sections = ["# :material/analytics: Resume Strength Analysis\n"]
+    for group, heading in OVERALL_GROUPS:
+        sections.append(heading)
+        sections.append("\n".join(
+            f"- {SEVERITY_ICONS[f.severity]} {f.message}"
+            for f in findings if f.rule.startswith(group + ".")
+        ))
+        sections.append("")
+
+    sections.append("---\n")
+    sections.append(f"## Overall Score: **{score}/100**\n")
+    if score >= 85:
+        rating = ":material/star: **Excellent** - Your resume is strong and ready!"
+    elif score >= 70:
+        rating = ":material/thumb_up: **Good** - Minor improvements will make it great"
+    elif score >= 50:
+        rating = ":material/warning: **Fair** - Needs some work to stand out"
+    else:
+        rating = ":material/build: **Needs Improvement** - Focus on the suggestions above"
+    sections.append(rating)
+    return "\n".join(sections)
@@ -1,113 +1,386 @@
+import copy
 import os
-import shutil
-from reportlab.lib.pagesizes import A4
-from reportlab.lib import colors
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, HRFlowable
+import tempfile
+from io import BytesIO
+from reportlab import Version as REPORTLAB_VERSION
+from reportlab.platypus import Paragraph, Spacer, HRFlowable
 from reportlab.lib.units import cm
+from core.cache import LRUCache, content_hash
+from core.layout import (
+    MAIN_TEXT_WIDTH, SIDEBAR_TEXT_WIDTH, HEADER_TEXT_WIDTH,
+    PageLimitReached, ResumeDocTemplate, column_height, estimate_pages, stack_extent,
+)
+from core.profiling import RenderProfile
+from core.themes import DEFAULT_THEME, ThemeRegistry
+
+# Bump when the layout or styling changes so cached renders are invalidated.
+TEMPLATE_VERSION = "2"
+
+# Prefix of the error returned when an entry lacks a field the layout needs.
+MISSING_FIELD = "Missing field"
+
+# Theme scales tried by ``fit_pages``, largest first.
+FIT_SCALES = (1.0, 0.95, 0.9, 0.85, 0.8, 0.75, 0.7)
+
 
 class Generator:
+    cache = LRUCache(max_entries=256, max_bytes=64 * 1024 * 1024)
+    section_cache = LRUCache(max_entries=2048)
+    measure_cache = LRUCache(max_entries=8192)
+    profile_hooks = []
+
     @staticmethod
-    def generate_pdf(data):
-        """Generates a professional A4 PDF with a two-column layout."""
-        output_dir = "resume_output"
-        if os.path.exists(output_dir):
-            shutil.rmtree(output_dir)
-        os.makedirs(output_dir, exist_ok=True)
-        pdf_path = os.path.join(output_dir, "resume.pdf")
-
-        doc = SimpleDocTemplate(
-            pdf_path,
-            pagesize=A4,
-            rightMargin=1*cm,
-            leftMargin=1*cm,
-            topMargin=1*cm,
-            bottomMargin=1*cm
-        )
-        
-        styles = getSampleStyleSheet()
-        
-        title_style = ParagraphStyle(
-            'NameStyle', parent=styles['Heading1'], fontSize=24, 
-            textColor=colors.HexColor("#2C3E50"), spaceAfter=2
-        )
-        subtitle_style = ParagraphStyle(
-            'SubStyle', parent=styles['Normal'], fontSize=12, 
-            textColor=colors.HexColor("#7F8C8D"), spaceAfter=10
-        )
-        section_header = ParagraphStyle(
-            'SectionHeader', parent=styles['Heading2'], fontSize=14, 
-            textColor=colors.HexColor("#2980B9"), spaceBefore=10, spaceAfter=5
+    def render_key(data, theme=DEFAULT_THEME, fit_pages=None):
+        """Returns the content hash identifying the rendered output of ``data``.
+
+        It hashes the section plan rather than the raw form, so fields the
+        layout ignores don't change it and defaults (a missing name renders as
+        "APPLICANT", an empty one as blank) are keyed the way they render.
+        """
+        if isinstance(theme, str):
+            theme = ThemeRegistry.get(theme)
+        return content_hash(
+            Generator._plan(data), TEMPLATE_VERSION, REPORTLAB_VERSION, theme.name, theme.version, fit_pages
         )
-        body_text = ParagraphStyle(
-            'Body', parent=styles['Normal'], fontSize=10, 
-            leading=12, alignment=0
+
+    @staticmethod
+    def etag(data, theme=DEFAULT_THEME, fit_pages=None):
+        """Returns a quoted HTTP ETag for the deterministic render of ``data``.
+
+        It is derived from the input, so it can be checked against
+        ``If-None-Match`` before rendering anything.
+        """
+        return f'"{Generator.render_key(data, theme, fit_pages)}"'
+
+    @staticmethod
+    def generate_pdf(data, theme=DEFAULT_THEME, use_cache=True, max_pages=None, fit_pages=None,
+                     profile=None, deterministic=True):
+        """Generates a professional A4 PDF with a two-column layout.
+
+        The document is built in memory and returned as bytes, so concurrent
+        sessions never share a file on disk. Use ``save_pdf`` to persist it.
+        Identical resumes are served from a process-wide render cache.
+        ``max_pages`` stops layout early, e.g. for a first-page preview.
+        ``fit_pages`` scales fonts and spacing down until the resume fits on
+        that many pages; the smallest scale is used if it never fits.
+        Stage timings are recorded on ``profile`` (a ``RenderProfile``) if
+        given and passed to every function in ``profile_hooks``.
+        ``deterministic`` fixes the embedded timestamp and document ID so the
+        same input always yields the same bytes; only those renders are cached.
+        """
+        profile = profile or RenderProfile()
+        pdf_bytes, error, cache = Generator._generate(
+            data, theme, use_cache and deterministic, max_pages, fit_pages, profile, deterministic
         )
-        sidebar_text = ParagraphStyle(
-            'Sidebar', parent=styles['Normal'], fontSize=9, 
-            textColor=colors.whitesmoke, leading=11
+        profile.finish(
+            operation="render", theme=getattr(theme, "name", theme), cache=cache, max_pages=max_pages,
+            fit_pages=fit_pages, bytes=len(pdf_bytes or b""), error=error,
         )
+        Generator._emit(profile)
+        return pdf_bytes, error
+
+    @staticmethod
+    def _generate(data, theme, use_cache, max_pages, fit_pages, profile, deterministic):
+        try:
+            with profile.stage("theme"):
+                theme = ThemeRegistry.get(theme) if isinstance(theme, str) else theme
+        except KeyError as e:
+            return None, e.args[0], "bypass"
+
+        if not use_cache or max_pages:
+            pdf_bytes, error = Generator._build_pdf(
+                data, theme, max_pages, fit_pages, profile, deterministic
+            )
+            return pdf_bytes, error, "bypass"
+
+        with profile.stage("cache_lookup"):
+            key = Generator.render_key(data, theme, fit_pages)
+            pdf_bytes = Generator.cache.get(key)
+        if pdf_bytes is not None:
+            return pdf_bytes, None, "hit"
+
+        pdf_bytes, error = Generator._build_pdf(data, theme, None, fit_pages, profile, deterministic)
+        if pdf_bytes is not None:
+            Generator.cache.put(key, pdf_bytes)
+        return pdf_bytes, error, "miss"
+
+    @staticmethod
+    def add_profile_hook(hook):
+        """Registers ``hook(profile)`` to be called after every render, e.g. ``log_profile``."""
+        if hook not in Generator.profile_hooks:
+            Generator.profile_hooks.append(hook)
+
+    @staticmethod
+    def _emit(profile):
+        for hook in list(Generator.profile_hooks):
+            try:
+                hook(profile)
+            except Exception:
+                pass  # Diagnostics must never fail a render
+
+    @staticmethod
+    def cache_stats():
+        """Returns hit/miss/eviction counters for the render cache."""
+        return Generator.cache.stats()
+
+    @staticmethod
+    def _build_pdf(data, theme, max_pages, fit_pages, profile, deterministic):
+        with profile.stage("plan"):
+            plan = Generator._plan(data)
+        if not fit_pages:
+            pdf_bytes, error, _ = Generator._render(plan, theme, max_pages, profile, deterministic)
+            return pdf_bytes, error
+
+        # The estimate comes from cached section measurements; full builds
+        # confirm it, stopping one page past the target when it overflows.
+        try:
+            with profile.stage("measure"):
+                *larger, smallest = Generator._fit_candidates(plan, theme, fit_pages)
+        except KeyError as e:
+            return None, f"{MISSING_FIELD} {e}"
+        except Exception as e:
+            return None, str(e)
+        for scaled in larger:
+            pdf_bytes, error, pages = Generator._render(
+                plan, scaled, fit_pages + 1, profile, deterministic
+            )
+            if error:
+                return None, error
+            if pages <= fit_pages:
+                if not max_pages or pages <= max_pages:
+                    return pdf_bytes, None
+                smallest = scaled  # Fits, but still has to be cut at max_pages
+                break
+        pdf_bytes, error, _ = Generator._render(plan, smallest, max_pages, profile, deterministic)
+        return pdf_bytes, error
+
+    @staticmethod
+    def _plan(data):
+        """Returns the ``(kind, payload)`` sections of the header, sidebar and main column."""
+        header = [("header", {
+            "name": data.get("name", "Applicant"),
+            "title": data.get("title", ""),
+        })]
+
+        sidebar = [("contact", {
+            "email": data.get("email", ""),
+            "phone": data.get("phone", ""),
+            "location": data.get("location", ""),
+        })]
+        for section in data.get("custom_sections", []):
+            sidebar.append(("custom_section", section))
+
+        main = []
 
-        elements = []
-
-        elements.append(Paragraph(data.get("name", "Applicant").upper(), title_style))
-        elements.append(Paragraph(data.get("title", ""), subtitle_style))
-        elements.append(HRFlowable(width="100%", thickness=1, color=colors.HexColor("#BDC3C7"), spaceAfter=15))
-
-        
-        sidebar_items = []
-        sidebar_items.append(Paragraph("<b>CONTACT</b>", sidebar_text))
-        sidebar_items.append(Spacer(1, 0.2*cm))
-        sidebar_items.append(Paragraph(data.get("email", ""), sidebar_text))
-        sidebar_items.append(Paragraph(data.get("phone", ""), sidebar_text))
-        sidebar_items.append(Paragraph(data.get("location", ""), sidebar_text))
-        
-        if "custom_sections" in data:
-            for section in data["custom_sections"]:
-                sidebar_items.append(Spacer(1, 0.5*cm))
-                sidebar_items.append(Paragraph(f"<b>{section['title'].upper()}</b>", sidebar_text))
-                sidebar_items.append(Spacer(1, 0.2*cm))
-                content_bullets = section['content'].replace('\n', '<br/>')
-                sidebar_items.append(Paragraph(content_bullets, sidebar_text))
-
-        main_items = []
-        
         if data.get("summary"):
-            main_items.append(Paragraph("<b>PROFESSIONAL SUMMARY</b>", section_header))
-            main_items.append(Paragraph(data["summary"], body_text))
+            main.append(("summary", data["summary"]))
 
         if data.get("experience"):
-            main_items.append(Paragraph("<b>WORK EXPERIENCE</b>", section_header))
-            for exp in data["experience"]:
-                header = f"<b>{exp['position']}</b> | {exp['company']}"
-                dates = f"<i>{exp['start_date']} — {exp['end_date']}</i>"
-                main_items.append(Paragraph(header, body_text))
-                main_items.append(Paragraph(dates, body_text))
-                main_items.append(Paragraph(exp.get("highlights", "").replace('\n', '<br/>'), body_text))
-                main_items.append(Spacer(1, 0.3*cm))
+            main.append(("heading", "WORK EXPERIENCE"))
+            main += [("experience", exp) for exp in data["experience"]]
 
         if data.get("education"):
-            main_items.append(Paragraph("<b>EDUCATION</b>", section_header))
-            for edu in data["education"]:
-                edu_line = f"<b>{edu['degree']}</b>, {edu['institution']}"
-                main_items.append(Paragraph(edu_line, body_text))
-                main_items.append(Paragraph(f"<i>{edu['start_date']} — {edu['end_date']}</i>", body_text))
-                main_items.append(Spacer(1, 0.2*cm))
-
-        col_widths = [5.5*cm, 13.5*cm]
-        layout_table = Table([[sidebar_items, main_items]], colWidths=col_widths)
-        layout_table.setStyle(TableStyle([
-            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-            ('BACKGROUND', (0, 0), (0, 0), colors.HexColor("#2C3E50")), # Dark Sidebar
-            ('LEFTPADDING', (0, 0), (-1, -1), 10),
-            ('RIGHTPADDING', (0, 0), (-1, -1), 10),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 20),
-        ]))
-
-        elements.append(layout_table)
-        
+            main.append(("heading", "EDUCATION"))
+            main += [("education", edu) for edu in data["education"]]
+
+        return header, sidebar, main
+
+    @staticmethod
+    def _render(plan, theme, max_pages, profile, deterministic):
+        """Builds the planned sections and returns ``(pdf_bytes, error, page_count)``."""
+        buffer = BytesIO()
         try:
-            doc.build(elements)
-            return pdf_path, None
+            # Section builders index into entry dicts, so bad input fails here, not in the caller
+            with profile.stage("flowables"):
+                header, sidebar, main = (
+                    [f for kind, payload in column for f in Generator._section(kind, payload, theme)]
+                    for column in plan
+                )
+
+            doc = ResumeDocTemplate(
+                buffer,
+                header=header,
+                sidebar=sidebar,
+                sidebar_color=theme.colors["sidebar_bg"],
+                max_pages=max_pages,
+                invariant=1 if deterministic else 0,
+            )
+
+            with profile.stage("layout"):
+                try:
+                    doc.build(doc.story(header, main))
+                except PageLimitReached:
+                    doc.canv.showPage()
+                    doc.canv.save()
+            return buffer.getvalue(), None, doc.page
+        except KeyError as e:
+            return None, f"{MISSING_FIELD} {e}", 0
         except Exception as e:
-            return None, str(e)
\ No newline at end of file
+            return None, str(e), 0
+
+    @staticmethod
+    def _fit_candidates(plan, theme, pages):
+        """Returns scaled themes from the largest estimated to fit down to the smallest."""
+        scaled = [ThemeRegistry.get(theme.name, scale) for scale in FIT_SCALES]
+
+        # Estimated page count only grows with scale, so binary search for
+        # the first scale that fits
+        low, high = 0, len(scaled) - 1
+        while low < high:
+            mid = (low + high) // 2
+            if Generator._estimate_pages(plan, scaled[mid]) <= pages:
+                high = mid
+            else:
+                low = mid + 1
+        return scaled[low:]
+
+    @staticmethod
+    def _estimate_pages(plan, theme):
+        header, sidebar, main = plan
+        header_extent = Generator._measure(*header[0], theme, HEADER_TEXT_WIDTH)
+        sidebar_height = column_height(
+            [Generator._measure(kind, payload, theme, SIDEBAR_TEXT_WIDTH) for kind, payload in sidebar]
+        )
+        main_height = column_height(
+            [Generator._measure(kind, payload, theme, MAIN_TEXT_WIDTH) for kind, payload in main]
+        )
+        return estimate_pages(header_extent, sidebar_height, main_height)
+
+    @staticmethod
+    def _measure(kind, payload, theme, width):
+        """Returns the cached ``stack_extent`` of one section at ``width``."""
+        key = (Generator._section_key(kind, payload, theme), width)
+        extent = Generator.measure_cache.get(key)
+        if extent is None:
+            extent = stack_extent(Generator._section(kind, payload, theme), width)
+            Generator.measure_cache.put(key, extent)
+        return extent
+
+    @staticmethod
+    def _section_key(kind, payload, theme):
+        return content_hash(kind, payload, theme.version, TEMPLATE_VERSION)
+
+    @staticmethod
+    def _section(kind, payload, theme):
+        """Returns fresh flowables for one section, reusing cached definitions.
+
+        Flowables are keyed by the section's own data and the theme, so editing
+        one experience entry only rebuilds (and re-parses) that entry. Shallow
+        copies are handed out because layout stores per-build state on them.
+        """
+        key = Generator._section_key(kind, payload, theme)
+        flowables = Generator.section_cache.get(key)
+        if flowables is None:
+            flowables = tuple(SECTION_BUILDERS[kind](payload, theme))
+            Generator.section_cache.put(key, flowables)
+        return [copy.copy(f) for f in flowables]
+
+    @staticmethod
+    def save_pdf(pdf_bytes, output_dir="resume_output"):
+        """Writes rendered bytes to a unique per-request file and returns its path."""
+        profile = RenderProfile(operation="save")
+        with profile.stage("io"):
+            os.makedirs(output_dir, exist_ok=True)
+            fd, pdf_path = tempfile.mkstemp(prefix="resume_", suffix=".pdf", dir=output_dir)
+            with os.fdopen(fd, "wb") as f:
+                f.write(pdf_bytes)
+        profile.finish(bytes=len(pdf_bytes), path=pdf_path)
+        Generator._emit(profile)
+        return pdf_path
+
+
+class CachedParagraph(Paragraph):
+    """Paragraph that memoizes line breaking per width.
+
+    The memo is shared by the shallow copies ``Generator._section`` hands
+    out, so an unchanged section skips both markup parsing and line breaking.
+    """
+
+    def __init__(self, text, style, **kwargs):
+        super().__init__(text, style, **kwargs)
+        self._line_cache = {}
+
+    def breakLines(self, width):
+        key = tuple(width) if isinstance(width, (list, tuple)) else width
+        state = self._line_cache.get(key)
+        if state is None:
+            blPara = super().breakLines(width)
+            state = (blPara, self.frags, self._width_max,
+                     self._splitLongWordCount, self._hyphenations)
+            self._line_cache[key] = state
+        (blPara, self.frags, self._width_max,
+         self._splitLongWordCount, self._hyphenations) = state
+        return blPara
+
+
+def _header_flowables(header, theme):
+    return [
+        CachedParagraph(header["name"].upper(), theme.styles["title"]),
+        CachedParagraph(header["title"], theme.styles["subtitle"]),
+        HRFlowable(width="100%", thickness=1, color=theme.colors["rule"], spaceAfter=15*theme.scale),
+    ]
+
+
+def _contact_flowables(contact, theme):
+    sidebar_text = theme.styles["sidebar"]
+    return [
+        CachedParagraph("<b>CONTACT</b>", sidebar_text),
+        Spacer(1, 0.2*cm*theme.scale),
+        CachedParagraph(contact["email"], sidebar_text),
+        CachedParagraph(contact["phone"], sidebar_text),
+        CachedParagraph(contact["location"], sidebar_text),
+    ]
+
+
+def _custom_section_flowables(section, theme):
+    sidebar_text = theme.styles["sidebar"]
+    content_bullets = section['content'].replace('\n', '<br/>')
+    return [
+        Spacer(1, 0.5*cm*theme.scale),
+        CachedParagraph(f"<b>{section['title'].upper()}</b>", sidebar_text),
+        Spacer(1, 0.2*cm*theme.scale),
+        CachedParagraph(content_bullets, sidebar_text),
+    ]
+
+
+def _heading_flowables(title, theme):
+    return [CachedParagraph(f"<b>{title}</b>", theme.styles["section_header"])]
+
+
+def _summary_flowables(summary, theme):
+    return _heading_flowables("PROFESSIONAL SUMMARY", theme) + [
+        CachedParagraph(summary, theme.styles["body"]),
+    ]
+
+
+def _experience_flowables(exp, theme):
+    body_text = theme.styles["body"]
+    header = f"<b>{exp['position']}</b> | {exp['company']}"
+    dates = f"<i>{exp['start_date']} — {exp['end_date']}</i>"
+    return [
+        CachedParagraph(header, body_text),
+        CachedParagraph(dates, body_text),
+        CachedParagraph(exp.get("highlights", "").replace('\n', '<br/>'), body_text),
+        Spacer(1, 0.3*cm*theme.scale),
+    ]
+
+
+def _education_flowables(edu, theme):
+    body_text = theme.styles["body"]
+    edu_line = f"<b>{edu['degree']}</b>, {edu['institution']}"
+    return [
+        CachedParagraph(edu_line, body_text),
+        CachedParagraph(f"<i>{edu['start_date']} — {edu['end_date']}</i>", body_text),
+        Spacer(1, 0.2*cm*theme.scale),
+    ]
+
+
+SECTION_BUILDERS = {
+    "header": _header_flowables,
+    "contact": _contact_flowables,
+    "custom_section": _custom_section_flowables,
+    "heading": _heading_flowables,
+    "summary": _summary_flowables,
+    "experience": _experience_flowables,
+    "education": _education_flowables,
+}
@@ -0,0 +1,44 @@
+import time
+from typing import Any, Callable, Optional, Tuple
+from core.cache import content_hash
+
+# Analysis time allowed per rerun, so typing stays responsive however long the resume gets
+INLINE_BUDGET_MS = 25.0
+
+
+class InlineSuggestions:
+    """As-you-type suggestions for a single session.
+
+    Call ``start`` once per rerun, then ``suggest`` for each field shown.
+    A field is only analyzed again when its text has changed, and only while
+    the rerun's analysis budget lasts. The budget is charged for time spent
+    in ``analyze`` only, not for rendering the rest of the page. Fields left
+    over keep their previous suggestions, marked stale, and are counted in
+    ``deferred`` so the caller can schedule another rerun to pick them up.
+    """
+
+    def __init__(self, budget_ms=INLINE_BUDGET_MS):
+        self.budget = budget_ms / 1000
+        self.results = {}  # field key -> (text hash, suggestions)
+        self.spent = 0.0
+        self.deferred = 0
+
+    def start(self):
+        self.spent = 0.0
+        self.deferred = 0
+
+    def suggest(self, key: str, text: str, analyze: Callable[[str], Any]) -> Tuple[Optional[Any], bool]:
+        """Returns ``(suggestions, is_stale)`` for one field."""
+        digest = content_hash(text)
+        previous = self.results.get(key)
+        if previous is not None and previous[0] == digest:
+            return previous[1], False
+        if self.spent >= self.budget:
+            self.deferred += 1
+            return (previous[1] if previous else None), True
+
+        start = time.perf_counter()
+        suggestions = analyze(text)
+        self.spent += time.perf_counter() - start
+        self.results[key] = (digest, suggestions)
+        return suggestions, False
@@ -0,0 +1,196 @@
+"""Job-description matching with TF-IDF vectors over a prebuilt IDF table.
+
+Usage:
+    python -m core.jobmatch build postings.jsonl -o job_index/
+    python -m core.jobmatch build postings.txt -o job_index/ --min-df 3
+
+The builder streams a corpus of job postings (JSONL records with a
+``description`` or ``text`` field, or plain text with one posting per line)
+and writes the vocabulary and IDF weights as ``.npy`` arrays. At runtime they
+are memory-mapped, so loading the index costs nothing however large the
+vocabulary is, and terms are looked up with a binary search over the sorted
+vocabulary.
+"""
+
+import argparse
+import json
+import math
+import os
+import re
+import sys
+import threading
+from collections import Counter
+from typing import List, NamedTuple, Optional, Tuple
+import numpy as np
+from core.analysis import iter_text_fields
+from core.cache import LRUCache, content_hash
+
+DEFAULT_INDEX_DIR = "job_index"
+MAX_TERM_LENGTH = 32  # Vocabulary is stored as fixed-width strings
+TOKEN_PATTERN = re.compile(r"[a-z][a-z0-9+#]*(?:[.-][a-z0-9+#]+)*")
+STOPWORDS = frozenset("""
+a about above across after all also an and any are as at be been being both but by can
+could do does each etc for from had has have how if in into is it its may more most must
+not of on or other our over own per should so some such than that the their them then
+there these they this those through to under up us via was we well were what when where
+which while who will with within without would you your
+""".split())
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercased word tokens, keeping terms like ``c++``, ``c#`` and ``node.js`` whole."""
+    return [
+        token for token in TOKEN_PATTERN.findall(text.lower())
+        if len(token) <= MAX_TERM_LENGTH and token not in STOPWORDS
+    ]
+
+
+class JobMatch(NamedTuple):
+    score: int                 # 0-100, cosine similarity of the TF-IDF vectors
+    matched: Tuple[str, ...]   # job terms the resume has, most important first
+    missing: Tuple[str, ...]   # job terms the resume lacks, most important first
+
+
+class TfidfIndex:
+    """Sorted vocabulary with IDF weights; terms outside it get the maximum IDF."""
+
+    vector_cache = LRUCache(max_entries=256)
+
+    def __init__(self, terms: np.ndarray, idf: np.ndarray, documents: int):
+        self.terms = terms
+        self.idf = idf
+        self.documents = documents
+        self.unseen_idf = math.log(documents + 1) + 1.0  # Smoothed IDF of a term with df=0
+        self.version = content_hash(len(terms), documents, float(idf.sum()) if len(idf) else 0.0)
+
+    @staticmethod
+    def load(path: str) -> "TfidfIndex":
+        with open(os.path.join(path, "meta.json"), encoding="utf-8") as f:
+            meta = json.load(f)
+        terms = np.load(os.path.join(path, "terms.npy"), mmap_mode="r")
+        idf = np.load(os.path.join(path, "idf.npy"), mmap_mode="r")
+        return TfidfIndex(terms, idf, meta["documents"])
+
+    @staticmethod
+    def empty() -> "TfidfIndex":
+        """An index without a corpus: every term weighs the same."""
+        return TfidfIndex(np.array([], dtype=f"<U{MAX_TERM_LENGTH}"), np.array([], dtype=np.float32), 0)
+
+    def vectorize(self, text: str) -> Tuple[np.ndarray, np.ndarray]:
+        """Returns the L2-normalised TF-IDF vector of ``text`` as sorted (terms, weights)."""
+        key = (self.version, text)
+        vector = TfidfIndex.vector_cache.get(key)
+        if vector is None:
+            vector = self._vectorize(text)
+            TfidfIndex.vector_cache.put(key, vector)
+        return vector
+
+    def _vectorize(self, text):
+        terms, counts = np.unique(np.array(tokenize(text), dtype=f"<U{MAX_TERM_LENGTH}"), return_counts=True)
+        idf = np.full(len(terms), self.unseen_idf)
+        if len(self.terms) and len(terms):
+            positions = np.searchsorted(self.terms, terms).clip(max=len(self.terms) - 1)
+            known = self.terms[positions] == terms
+            idf[known] = self.idf[positions[known]]
+        weights = (1.0 + np.log(counts)) * idf  # Sublinear TF
+        norm = np.linalg.norm(weights)
+        return terms, weights / norm if norm else weights
+
+    def match(self, resume_text: str, job_text: str, limit: int = 15) -> JobMatch:
+        resume_terms, resume_weights = self.vectorize(resume_text)
+        job_terms, job_weights = self.vectorize(job_text)
+        _, in_resume, in_job = np.intersect1d(resume_terms, job_terms, assume_unique=True, return_indices=True)
+        similarity = float(resume_weights[in_resume] @ job_weights[in_job])
+
+        order = np.argsort(-job_weights, kind="stable")
+        present = np.zeros(len(job_terms), dtype=bool)
+        present[in_job] = True
+        return JobMatch(
+            score=round(100 * min(similarity, 1.0)),
+            matched=tuple(job_terms[order][present[order]][:limit].tolist()),
+            missing=tuple(job_terms[order][~present[order]][:limit].tolist()),
+        )
+
+
+class JobIndexRegistry:
+    _loaded = {}
+    _default_path = DEFAULT_INDEX_DIR
+    _lock = threading.Lock()
+
+    @staticmethod
+    def set_default(path: Optional[str]):
+        JobIndexRegistry._default_path = path
+
+    @staticmethod
+    def get(path: Optional[str] = None) -> TfidfIndex:
+        """Returns the index in ``path`` (memory-mapped once), or an empty one if none was built."""
+        path = path or JobIndexRegistry._default_path
+        index = JobIndexRegistry._loaded.get(path)
+        if index is not None:
+            return index
+        with JobIndexRegistry._lock:
+            index = JobIndexRegistry._loaded.get(path)
+            if index is None:
+                if path and os.path.exists(os.path.join(path, "meta.json")):
+                    index = TfidfIndex.load(path)
+                else:
+                    index = TfidfIndex.empty()
+                JobIndexRegistry._loaded[path] = index
+        return index
+
+
+def match_resume(form_data: dict, job_text: str, index_path: Optional[str] = None) -> JobMatch:
+    """Scores a resume against a pasted job description."""
+    resume_text = "\n".join(field.text for field in iter_text_fields(form_data))
+    return JobIndexRegistry.get(index_path).match(resume_text, job_text)
+
+
+def iter_postings(path):
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            if path.lower().endswith(".jsonl"):
+                record = json.loads(line)
+                yield record.get("description") or record.get("text") or ""
+            else:
+                yield line
+
+
+def build_index(corpus_path: str, output_dir: str, min_df: int = 2) -> int:
+    """Counts document frequencies over the corpus and writes the index; returns the vocabulary size."""
+    df = Counter()
+    documents = 0
+    for posting in iter_postings(corpus_path):
+        df.update(set(tokenize(posting)))
+        documents += 1
+
+    vocabulary = sorted(term for term, count in df.items() if count >= min_df)
+    terms = np.array(vocabulary, dtype=f"<U{MAX_TERM_LENGTH}")
+    counts = np.array([df[term] for term in vocabulary], dtype=np.float64)
+    idf = (np.log((documents + 1) / (counts + 1)) + 1.0).astype(np.float32)
+
+    os.makedirs(output_dir, exist_ok=True)
+    np.save(os.path.join(output_dir, "terms.npy"), terms)
+    np.save(os.path.join(output_dir, "idf.npy"), idf)
+    with open(os.path.join(output_dir, "meta.json"), "w", encoding="utf-8") as f:
+        json.dump({"documents": documents, "terms": len(vocabulary), "min_df": min_df}, f)
+    return len(vocabulary)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build the IDF index used for job-description matching.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    build = commands.add_parser("build", help="Index a corpus of job postings")
+    build.add_argument("corpus", help="JSONL file of postings, or text with one posting per line")
+    build.add_argument("-o", "--output", default=DEFAULT_INDEX_DIR, help="Index directory")
+    build.add_argument("--min-df", type=int, default=2, help="Drop terms seen in fewer postings")
+    args = parser.parse_args(argv)
+
+    size = build_index(args.corpus, args.output, args.min_df)
+    print(f"Indexed {size} terms into {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
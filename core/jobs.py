@@ -0,0 +1,110 @@
+import threading
+import time
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+
+PENDING = "pending"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+CANCELLED = "cancelled"
+UNKNOWN = "unknown"
+
+
+class QueueFull(Exception):
+    """Raised when the queue is at capacity and cannot accept more jobs."""
+
+
+@dataclass
+class Job:
+    id: str
+    future: Future
+    submitted_at: float = field(default_factory=time.monotonic)
+    cancelled: bool = False
+
+
+class JobQueue:
+    """Bounded background worker pool with job ids, polling and cancellation.
+
+    ``max_pending`` caps queued plus running jobs across every session in the
+    process, so bursts of clicks get pushed back instead of piling up.
+    """
+
+    def __init__(self, max_workers=2, max_pending=8, ttl=600):
+        self.max_pending = max_pending
+        self.ttl = ttl
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="render")
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._jobs = {}
+        self._lock = threading.Lock()
+
+    def submit(self, fn, *args, **kwargs) -> str:
+        if not self._slots.acquire(blocking=False):
+            raise QueueFull(f"Render queue is full ({self.max_pending} jobs in flight)")
+        self._expire()
+
+        job_id = uuid.uuid4().hex
+        try:
+            future = self._executor.submit(fn, *args, **kwargs)
+        except Exception:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        with self._lock:
+            self._jobs[job_id] = Job(job_id, future)
+        return job_id
+
+    def status(self, job_id) -> str:
+        job = self._jobs.get(job_id)
+        if job is None:
+            return UNKNOWN
+        if job.cancelled or job.future.cancelled():
+            return CANCELLED
+        if job.future.running():
+            return RUNNING
+        if not job.future.done():
+            return PENDING
+        return FAILED if job.future.exception() is not None else DONE
+
+    def result(self, job_id, pop=True):
+        """Returns the job's return value once done; re-raises its exception."""
+        job = self._jobs.get(job_id)
+        if job is None or job.cancelled:
+            return None
+        value = job.future.result()
+        if pop:
+            self.forget(job_id)
+        return value
+
+    def cancel(self, job_id) -> bool:
+        """Cancels a job. A job already running finishes but its result is dropped."""
+        job = self._jobs.get(job_id)
+        if job is None or job.future.done():
+            return False
+        job.cancelled = True
+        job.future.cancel()
+        return True
+
+    def forget(self, job_id):
+        with self._lock:
+            self._jobs.pop(job_id, None)
+
+    def in_flight(self) -> int:
+        return sum(1 for job in list(self._jobs.values()) if not job.future.done())
+
+    def _expire(self):
+        cutoff = time.monotonic() - self.ttl
+        with self._lock:
+            stale = [
+                job_id
+                for job_id, job in self._jobs.items()
+                if job.future.done() and job.submitted_at < cutoff
+            ]
+            for job_id in stale:
+                del self._jobs[job_id]
+
+
+render_queue = JobQueue()
+# Live previews get their own slots so thumbnails never push back a download
+preview_queue = JobQueue(max_workers=1, max_pending=4)
@@ -0,0 +1,161 @@
+import math
+from reportlab.lib.pagesizes import A4
+from reportlab.lib.units import cm
+from reportlab.platypus import (
+    BaseDocTemplate, Flowable, Frame, FrameBreak, LayoutError, NextPageTemplate,
+    PageBreak, PageTemplate,
+)
+
+MARGIN = 1*cm
+SIDEBAR_WIDTH = 5.5*cm
+MAIN_WIDTH = 13.5*cm
+COLUMN_PADDING = {"leftPadding": 10, "rightPadding": 10, "topPadding": 3, "bottomPadding": 20}
+HEADER_PADDING = 6  # reportlab's default frame padding
+
+# Usable widths inside each frame, for measuring flowables outside a build
+HEADER_TEXT_WIDTH = A4[0] - 2*MARGIN - 2*HEADER_PADDING
+SIDEBAR_TEXT_WIDTH = SIDEBAR_WIDTH - COLUMN_PADDING["leftPadding"] - COLUMN_PADDING["rightPadding"]
+MAIN_TEXT_WIDTH = MAIN_WIDTH - COLUMN_PADDING["leftPadding"] - COLUMN_PADDING["rightPadding"]
+
+
+class PageLimitReached(Exception):
+    pass
+
+
+class ResumeDocTemplate(BaseDocTemplate):
+    """Two-column A4 layout whose columns flow across any number of pages.
+
+    The main column is the document story and flows through one frame per
+    page. The sidebar is a separate story that is poured into the sidebar
+    column as each page begins, on top of a background repeated on every
+    page. Extra pages are added at the end if the sidebar runs longer.
+    """
+
+    def __init__(self, filename, header, sidebar, sidebar_color, max_pages=None, **kwargs):
+        super().__init__(
+            filename,
+            pagesize=A4,
+            leftMargin=MARGIN,
+            rightMargin=MARGIN,
+            topMargin=MARGIN,
+            bottomMargin=MARGIN,
+            **kwargs
+        )
+        self.sidebar = list(sidebar)
+        self.sidebar_color = sidebar_color
+        self.max_pages = max_pages
+
+        header_height = header_frame_height(stack_extent(header, HEADER_TEXT_WIDTH))
+        page_top = self.bottomMargin + self.height
+        first_top = page_top - header_height
+        header_frame = Frame(self.leftMargin, first_top, self.width, header_height, id="header")
+
+        self.addPageTemplates([
+            PageTemplate(
+                "first",
+                frames=[header_frame, self._main_frame(first_top)],
+                onPage=lambda canv, doc: doc.draw_sidebar(canv, first_top),
+            ),
+            PageTemplate(
+                "later",
+                frames=[self._main_frame(page_top)],
+                onPage=lambda canv, doc: doc.draw_sidebar(canv, page_top),
+            ),
+        ])
+
+    def story(self, header, main):
+        """Returns the document story for the header and main column flowables."""
+        return header + [NextPageTemplate("later"), FrameBreak()] + main + [SidebarOverflow()]
+
+    def _main_frame(self, top):
+        return Frame(
+            self.leftMargin + SIDEBAR_WIDTH, self.bottomMargin,
+            MAIN_WIDTH, top - self.bottomMargin, id="main", **COLUMN_PADDING
+        )
+
+    def draw_sidebar(self, canv, top):
+        """Paints the sidebar background and as much of the sidebar as fits."""
+        height = top - self.bottomMargin
+        canv.saveState()
+        canv.setFillColor(self.sidebar_color)
+        canv.rect(self.leftMargin, self.bottomMargin, SIDEBAR_WIDTH, height, stroke=0, fill=1)
+        canv.restoreState()
+
+        frame = Frame(
+            self.leftMargin, self.bottomMargin, SIDEBAR_WIDTH, height,
+            id="sidebar", **COLUMN_PADDING
+        )
+        pending = self.sidebar
+        while pending:
+            flowable = pending[0]
+            if frame.add(flowable, canv, trySplit=1):
+                del pending[0]
+                continue
+            parts = frame.split(flowable, canv)
+            if parts and frame.add(parts[0], canv):
+                pending[0:1] = parts[1:]
+            elif frame._atTop:
+                raise LayoutError(f"Sidebar item too large for any page: {flowable.identity(60)}")
+            break
+
+    def afterPage(self):
+        if self.max_pages and self.page >= self.max_pages:
+            raise PageLimitReached()
+
+
+class SidebarOverflow(Flowable):
+    """Zero-size story terminator that adds pages while sidebar content remains."""
+
+    def wrap(self, availWidth, availHeight):
+        if self._doctemplateAttr("sidebar"):
+            self._doctemplateAttr("frame").add_generated_content(PageBreak(), SidebarOverflow())
+        return 0, 0
+
+    def draw(self):
+        pass
+
+
+def stack_extent(flowables, width):
+    """Measures flowables stacked in a frame of ``width`` without drawing them.
+
+    Returns ``(space_before, height, space_after)``: the outer spacing, which
+    collapses against neighbouring content, and the height in between.
+    """
+    extents = [(f.getSpaceBefore(), f.wrap(width, 1e6)[1], f.getSpaceAfter()) for f in flowables]
+    if not extents:
+        return 0, 0, 0
+    return extents[0][0], column_height(extents), extents[-1][2]
+
+
+def column_height(extents):
+    """Height of measured stacks placed one after another in a column.
+
+    Adjacent spacing overlaps the way ``Frame`` applies it, so only the
+    larger of a space-after and the following space-before is used.
+    """
+    height = 0
+    previous_after = None
+    for before, body, after in extents:
+        if previous_after is not None:
+            height += max(before, previous_after)
+        height += body
+        previous_after = after
+    return height
+
+
+def header_frame_height(extent):
+    _, height, space_after = extent
+    return height + space_after + 2*HEADER_PADDING
+
+
+def estimate_pages(header_extent, sidebar_height, main_height):
+    """Page count for measured column heights, ignoring space lost at page breaks."""
+    page_top = A4[1] - MARGIN
+    padding = COLUMN_PADDING["topPadding"] + COLUMN_PADDING["bottomPadding"]
+    later = page_top - MARGIN - padding
+    first = later - header_frame_height(header_extent)
+
+    def pages(height):
+        return 1 if height <= first else 1 + math.ceil((height - first) / later)
+
+    return max(pages(sidebar_height), pages(main_height))
@@ -0,0 +1,117 @@
+import json
+import threading
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Optional, Tuple
+import yaml
+from core import data
+from core.cache import content_hash
+from core.matcher import PhraseMatcher
+
+SECTIONS = ("action_verbs", "weak_words", "industry_keywords")
+
+
+@dataclass(frozen=True)
+class Lexicon:
+    """Lexicon terms with hash indexes built once at load time.
+
+    Sets and reverse maps are keyed by ``str.casefold()`` so every lookup is
+    a single case-insensitive hash probe however large the lexicon is.
+    """
+
+    action_verbs: MappingProxyType        # category -> terms
+    weak_words: Tuple[str, ...]
+    industry_keywords: MappingProxyType   # industry -> terms
+    verb_set: frozenset
+    weak_set: frozenset
+    keyword_set: frozenset
+    verb_categories: MappingProxyType     # folded verb -> categories
+    keyword_industries: MappingProxyType  # folded keyword -> industries
+    matcher: PhraseMatcher
+    version: str                          # content hash of the source terms
+
+    def is_action_verb(self, word: str) -> bool:
+        return word.casefold() in self.verb_set
+
+    def is_weak(self, phrase: str) -> bool:
+        return phrase.casefold() in self.weak_set
+
+    def is_keyword(self, term: str) -> bool:
+        return term.casefold() in self.keyword_set
+
+    def verbs_for(self, category: str) -> Tuple[str, ...]:
+        return self.action_verbs.get(category, self.action_verbs.get("technical", ()))
+
+
+class LexiconRegistry:
+    _loaded = {}
+    _default_path = None
+    _lock = threading.Lock()
+
+    @staticmethod
+    def set_default(path: Optional[str]):
+        """Makes ``get()`` without arguments load ``path`` instead of the built-in lists."""
+        LexiconRegistry._default_path = path
+
+    @staticmethod
+    def get(path: Optional[str] = None) -> Lexicon:
+        """Returns the lexicon from a YAML/JSON file (or the built-in one), loading it once."""
+        path = path or LexiconRegistry._default_path
+        lexicon = LexiconRegistry._loaded.get(path)
+        if lexicon is not None:
+            return lexicon
+        with LexiconRegistry._lock:
+            lexicon = LexiconRegistry._loaded.get(path)
+            if lexicon is None:
+                lexicon = LexiconRegistry._compile(LexiconRegistry._read(path))
+                LexiconRegistry._loaded[path] = lexicon
+        return lexicon
+
+    @staticmethod
+    def _read(path):
+        """Reads a lexicon file; sections it leaves out come from ``core/data.py``."""
+        source = {
+            "action_verbs": data.ACTION_VERBS,
+            "weak_words": data.WEAK_WORDS,
+            "industry_keywords": data.INDUSTRY_KEYWORDS,
+        }
+        if path:
+            with open(path, encoding="utf-8") as f:
+                if path.lower().endswith(".json"):
+                    loaded = json.load(f)
+                else:
+                    loaded = yaml.load(f, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
+            unknown = set(loaded or {}) - set(SECTIONS)
+            if unknown:
+                raise ValueError(f"Unknown lexicon sections in {path}: {', '.join(sorted(unknown))}")
+            source.update(loaded or {})
+        return source
+
+    @staticmethod
+    def _compile(source) -> Lexicon:
+        verbs = {cat: tuple(terms) for cat, terms in source["action_verbs"].items()}
+        weak = tuple(source["weak_words"])
+        keywords = {industry: tuple(terms) for industry, terms in source["industry_keywords"].items()}
+        return Lexicon(
+            action_verbs=MappingProxyType(verbs),
+            weak_words=weak,
+            industry_keywords=MappingProxyType(keywords),
+            verb_set=frozenset(_folded(verbs)),
+            weak_set=frozenset(term.casefold() for term in weak),
+            keyword_set=frozenset(_folded(keywords)),
+            verb_categories=MappingProxyType(_folded(verbs)),
+            keyword_industries=MappingProxyType(_folded(keywords)),
+            matcher=PhraseMatcher({"verb": verbs, "weak": weak, "industry": keywords}),
+            version=content_hash(source),
+        )
+
+
+def _folded(groups):
+    """Reverse map from folded term to the tuple of groups listing it."""
+    index = {}
+    for group, terms in groups.items():
+        for term in terms:
+            listed = index.setdefault(term.casefold(), [])
+            if group not in listed:
+                listed.append(group)
+    return {term: tuple(listed) for term, listed in index.items()}
@@ -0,0 +1,80 @@
+import re
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple, Union
+
+Lexicon = Union[Iterable[str], Dict[str, Iterable[str]]]
+
+
+class Match(NamedTuple):
+    start: int
+    end: int
+    term: str
+    tags: Tuple[Tuple[str, Optional[str]], ...]  # (group, category) pairs
+
+    def in_group(self, group: str) -> bool:
+        return any(tag_group == group for tag_group, _ in self.tags)
+
+
+class PhraseMatcher:
+    """Finds every lexicon phrase in a text in a single pass.
+
+    All terms are compiled into one case-insensitive regex whose
+    alternation is shaped like a trie, so terms sharing a prefix are tried
+    together and the scan does not slow down term by term as the lexicon
+    grows. Phrases only match on word boundaries and the longest phrase
+    wins where several start at the same place.
+    """
+
+    def __init__(self, groups: Dict[str, Lexicon]):
+        self._terms = {}
+        for group, lexicon in groups.items():
+            by_category = lexicon if isinstance(lexicon, dict) else {None: lexicon}
+            for category, terms in by_category.items():
+                for term in terms:
+                    canonical, tags = self._terms.get(term.casefold(), (term, ()))
+                    if (group, category) not in tags:
+                        tags += ((group, category),)
+                    self._terms[term.casefold()] = (canonical, tags)
+
+        self._pattern = None
+
+    @property
+    def pattern(self) -> re.Pattern:
+        """The compiled regex, built on first use since large lexicons take a while."""
+        if self._pattern is None:
+            self._pattern = re.compile(
+                r"(?<!\w)" + _trie_pattern(self._terms) + r"(?!\w)", re.IGNORECASE
+            )
+        return self._pattern
+
+    def finditer(self, text: str) -> Iterable[Match]:
+        for m in self.pattern.finditer(text):
+            entry = self._terms.get(m.group(0).casefold())
+            if entry is not None:  # Regex case-insensitivity is simpler than casefold()
+                yield Match(m.start(), m.end(), *entry)
+
+    def findall(self, text: str) -> List[Match]:
+        return list(self.finditer(text))
+
+    @staticmethod
+    def terms(matches: Iterable[Match], group: str) -> List[str]:
+        """Distinct terms of ``group`` among ``matches``, in order of appearance."""
+        return list(dict.fromkeys(m.term for m in matches if m.in_group(group)))
+
+
+def _trie_pattern(terms: Iterable[str]) -> str:
+    trie = {}
+    for term in terms:
+        node = trie
+        for char in term:
+            node = node.setdefault(char, {})
+        node[""] = {}
+    return _node_pattern(trie) or "(?!)"
+
+
+def _node_pattern(node: dict) -> str:
+    branches = [re.escape(char) + _node_pattern(child) for char, child in sorted(node.items()) if char]
+    if not branches:
+        return ""
+    body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+    # Greedy optional: try the longer phrase first, fall back to the one ending here
+    return f"(?:{body})?" if "" in node else body
@@ -0,0 +1,110 @@
+import copy
+import time
+from io import BytesIO
+import pypdfium2 as pdfium
+from core.cache import LRUCache
+from core.generator import Generator
+from core.jobs import DONE, FAILED, PENDING, RUNNING, QueueFull
+from core.themes import DEFAULT_THEME
+
+# Render scale relative to 72 dpi; 0.6 gives a ~360px wide A4 thumbnail.
+PREVIEW_SCALE = 0.6
+
+
+class PreviewRenderer:
+    cache = LRUCache(max_entries=64, max_bytes=16 * 1024 * 1024)
+
+    @staticmethod
+    def render_first_page(data, theme=DEFAULT_THEME, scale=PREVIEW_SCALE, fit_pages=None):
+        """Returns a low-resolution PNG of the first page, cached by content hash.
+
+        Only the first page is laid out and it is rasterised at thumbnail size,
+        so this is much cheaper than a download-quality render.
+        """
+        key = (Generator.render_key(data, theme, fit_pages), scale)
+        png = PreviewRenderer.cache.get(key)
+        if png is not None:
+            return png, None
+
+        pdf_bytes, error = Generator.generate_pdf(
+            data, theme=theme, max_pages=1, fit_pages=fit_pages
+        )
+        if error:
+            return None, error
+
+        pdf = pdfium.PdfDocument(pdf_bytes)
+        try:
+            image = pdf[0].render(scale=scale).to_pil()
+        finally:
+            pdf.close()
+        buffer = BytesIO()
+        image.save(buffer, format="PNG", compress_level=1)
+        png = buffer.getvalue()
+        PreviewRenderer.cache.put(key, png)
+        return png, None
+
+
+class LivePreview:
+    """Debounced, background first-page preview for a single session.
+
+    Call ``update`` on every rerun. It returns the latest available image
+    right away; a new preview is only rendered once the content has stopped
+    changing for ``debounce`` seconds, and never for content already shown.
+    """
+
+    def __init__(self, queue, debounce=0.75):
+        self.queue = queue
+        self.debounce = debounce
+        self.image = None
+        self.error = None
+        self.shown_key = None
+        self.pending_key = None
+        self.changed_at = 0.0
+        self.job_id = None
+        self.job_key = None
+
+    def update(self, data, theme=DEFAULT_THEME, fit_pages=None):
+        """Returns ``(png_bytes, is_stale)`` for the current content."""
+        key = Generator.render_key(data, theme, fit_pages)
+        if key == self.shown_key:
+            return self.image, False
+
+        if self.job_id is not None:
+            self._collect()
+            if key == self.shown_key:
+                return self.image, False
+
+        if key != self.pending_key:
+            cached = PreviewRenderer.cache.get((key, PREVIEW_SCALE))
+            if cached is not None:
+                self.image, self.error, self.shown_key = cached, None, key
+                return self.image, False
+            self.pending_key = key
+            self.changed_at = time.monotonic()
+        elif self.job_id is None and time.monotonic() - self.changed_at >= self.debounce:
+            try:
+                self.job_id = self.queue.submit(
+                    PreviewRenderer.render_first_page, copy.deepcopy(data), theme,
+                    fit_pages=fit_pages,
+                )
+                self.job_key = key
+            except QueueFull:
+                pass  # Try again on the next rerun
+        return self.image, True
+
+    def _collect(self):
+        status = self.queue.status(self.job_id)
+        if status in (PENDING, RUNNING):
+            return
+        if status == DONE:
+            png, self.error = self.queue.result(self.job_id)
+            if png is not None:
+                self.image = png
+            self.shown_key = self.job_key
+        elif status == FAILED:
+            try:
+                self.queue.result(self.job_id)
+            except Exception as e:
+                self.error = str(e)
+            self.shown_key = self.job_key
+        self.job_id = None
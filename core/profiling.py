@@ -0,0 +1,59 @@
+import json
+import logging
+import sys
+import time
+from contextlib import contextmanager
+
+logger = logging.getLogger("resume.render")
+
+
+class RenderProfile:
+    """Per-stage wall time and allocation counts for one render.
+
+    Stages that run more than once, such as layout during auto-fit, add up.
+    Allocations are the net change in ``sys.getallocatedblocks``, which also
+    sees other threads, so treat them as a signal rather than an exact count.
+    """
+
+    def __init__(self, **info):
+        self.info = info
+        self.stages = {}
+        self.total_ms = 0.0
+        self._started = time.perf_counter()
+
+    @contextmanager
+    def stage(self, name):
+        blocks = sys.getallocatedblocks()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = (time.perf_counter() - start) * 1000
+            entry = self.stages.setdefault(name, {"ms": 0.0, "alloc_blocks": 0, "calls": 0})
+            entry["ms"] += elapsed
+            entry["alloc_blocks"] += sys.getallocatedblocks() - blocks
+            entry["calls"] += 1
+
+    def finish(self, **info):
+        self.info.update(info)
+        self.total_ms = (time.perf_counter() - self._started) * 1000
+
+    def as_dict(self):
+        return {**self.info, "total_ms": round(self.total_ms, 3), "stages": {
+            name: {**entry, "ms": round(entry["ms"], 3)} for name, entry in self.stages.items()
+        }}
+
+
+def log_profile(profile):
+    """Profile hook that writes each render as one JSON line to the ``resume.render`` logger."""
+    logger.info(json.dumps(profile.as_dict(), default=str))
+
+
+def enable_profile_logging():
+    """Sends ``resume.render`` lines to stderr at INFO, unless logging is already configured for it."""
+    if logger.level == logging.NOTSET:
+        logger.setLevel(logging.INFO)
+    if not logger.hasHandlers():
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        logger.addHandler(handler)
@@ -0,0 +1,48 @@
+import csv
+import json
+import re
+
+
+def iter_records(path, on_error=None):
+    """Yields ``(record_id, data)`` pairs one at a time from a JSONL or CSV file.
+
+    Lines that do not decode to a JSON object are not yielded; instead
+    ``on_error(record_id, message)`` is called for each, if given, so one bad
+    line never stops the rest of the file from being read.
+    """
+    if path.lower().endswith(".csv"):
+        with open(path, newline="", encoding="utf-8") as f:
+            for line_no, row in enumerate(csv.DictReader(f), start=1):
+                data = {key: _decode_cell(value) for key, value in row.items()}
+                yield _record_id(data, line_no), data
+    else:
+        with open(path, encoding="utf-8") as f:
+            for line_no, line in enumerate(f, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    data = json.loads(line)
+                except json.JSONDecodeError as e:
+                    error = f"Line {line_no} is not valid JSON: {e.msg}"
+                else:
+                    if isinstance(data, dict):
+                        yield _record_id(data, line_no), data
+                        continue
+                    error = f"Line {line_no} is not a JSON object"
+                if on_error is not None:
+                    on_error(_record_id({}, line_no), error)
+
+
+def _decode_cell(value):
+    value = (value or "").strip()
+    if value[:1] in ("[", "{"):
+        try:
+            return json.loads(value)
+        except json.JSONDecodeError:
+            pass
+    return value
+
+
+def _record_id(data, line_no):
+    raw = str(data.get("id") or f"record_{line_no:07d}")
+    return re.sub(r"[^A-Za-z0-9_.-]", "_", raw)
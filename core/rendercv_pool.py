@@ -0,0 +1,136 @@
+import atexit
+import multiprocessing
+import os
+import queue
+import tempfile
+import threading
+
+WARMUP_CV = {
+    "cv": {
+        "name": "Warm Up",
+        "sections": {"Summary": ["Pre-warming the RenderCV worker."]},
+    },
+}
+
+
+def _render_in_worker(api, cv):
+    """Renders one CV inside an isolated temporary directory and returns bytes."""
+    with tempfile.TemporaryDirectory(prefix="rendercv_") as workdir:
+        pdf_path = os.path.join(workdir, "resume.pdf")
+        if isinstance(cv, str):
+            errors = api.create_a_pdf_from_a_yaml_string(cv, pdf_path)
+        else:
+            errors = api.create_a_pdf_from_a_python_dictionary(cv, pdf_path)
+        if errors:
+            return None, "; ".join(str(e.get("message", e)) for e in errors)
+        with open(pdf_path, "rb") as f:
+            return f.read(), None
+
+
+def _worker_main(conn):
+    """Long-lived worker loop: pays RenderCV's import and warm-up cost once."""
+    try:
+        from rendercv import api
+        _render_in_worker(api, WARMUP_CV)
+    except Exception as e:
+        conn.send((None, f"RenderCV failed to start: {e}"))
+        return
+    conn.send((b"", None))  # Ready
+
+    while True:
+        try:
+            cv = conn.recv()
+        except EOFError:
+            return
+        if cv is None:
+            return
+        try:
+            conn.send(_render_in_worker(api, cv))
+        except Exception as e:
+            conn.send((None, str(e)))
+
+
+class _Worker:
+    def __init__(self, context):
+        self.conn, child_conn = context.Pipe()
+        self.process = context.Process(target=_worker_main, args=(child_conn,), daemon=True)
+        self.process.start()
+        child_conn.close()
+        self.ready = False
+
+    def wait_ready(self, timeout):
+        if not self.ready:
+            if not self.conn.poll(timeout):
+                raise TimeoutError("RenderCV worker did not start in time")
+            _, error = self.conn.recv()
+            if error:
+                raise RuntimeError(error)
+            self.ready = True
+
+    def stop(self):
+        try:
+            self.conn.send(None)
+        except (BrokenPipeError, OSError):
+            pass
+        self.process.join(timeout=1)
+        if self.process.is_alive():
+            self.process.kill()
+        self.conn.close()
+
+
+class RenderCVPool:
+    """Pool of pre-warmed RenderCV worker processes.
+
+    Each worker imports RenderCV and renders a throwaway CV once at start-up,
+    then serves requests (YAML strings or dicts) over a pipe, so the
+    interpreter and template cold-start cost is not paid on every render.
+    """
+
+    _shared = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, size=2, start_method="spawn", startup_timeout=120):
+        self.size = size
+        self.startup_timeout = startup_timeout
+        self._context = multiprocessing.get_context(start_method)
+        self._idle = queue.Queue()
+        for _ in range(size):
+            self._idle.put(_Worker(self._context))
+        atexit.register(self.close)
+
+    @classmethod
+    def shared(cls):
+        """Returns the process-wide pool, starting it on first use."""
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    def render(self, cv, timeout=60):
+        """Renders a RenderCV YAML string or dict and returns ``(pdf_bytes, error)``."""
+        try:
+            worker = self._idle.get(timeout=timeout)
+        except queue.Empty:
+            return None, "All RenderCV workers are busy"
+
+        try:
+            worker.wait_ready(self.startup_timeout)
+            worker.conn.send(cv)
+            if not worker.conn.poll(timeout):
+                raise TimeoutError(f"Render did not finish within {timeout}s")
+            result = worker.conn.recv()
+        except Exception as e:
+            # The worker is in an unknown state; replace it
+            worker.stop()
+            self._idle.put(_Worker(self._context))
+            return None, str(e)
+
+        self._idle.put(worker)
+        return result
+
+    def close(self):
+        while True:
+            try:
+                self._idle.get_nowait().stop()
+            except queue.Empty:
+                return
@@ -0,0 +1,126 @@
+import threading
+import time
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+from core.analysis import TextAnalyzer, TextDocument, iter_text_fields
+from core.findings import Finding
+
+
+class ResumeTotals(NamedTuple):
+    bullets: int              # experience highlight lines
+    metrics: int              # quantified achievements
+    verbs: Tuple[str, ...]    # distinct action verbs
+    weak: Tuple[str, ...]     # distinct weak phrases
+
+
+class Document:
+    """The text (or entry) a target's rules run over.
+
+    Derived views are computed on first use and then shared by every rule,
+    so text is tokenized once however many rules read it, and not at all if
+    the rules that need it are short-circuited.
+    """
+
+    def __init__(self, section: str, text: str = "", data: Optional[dict] = None, entry: Optional[int] = None):
+        self.section = section
+        self.text = text
+        self.data = data if data is not None else {}
+        self.entry = entry
+
+    @cached_property
+    def analysis(self) -> TextDocument:
+        return TextAnalyzer.analyze(self.text)
+
+    @cached_property
+    def totals(self) -> ResumeTotals:
+        bullets = metrics = 0
+        verbs, weak = {}, {}
+        for field in iter_text_fields(self.data, lines=False):
+            analysis = TextAnalyzer.analyze(field.text)
+            if field.section == "experience" and field.field == "highlights":
+                bullets += analysis.bullet_count
+            metrics += analysis.metric_count
+            verbs.update(dict.fromkeys(analysis.verbs))
+            weak.update(dict.fromkeys(analysis.weak_phrases))
+        return ResumeTotals(bullets, metrics, tuple(verbs), tuple(weak))
+
+    def finding(self, rule: str, severity: str, span=None, params=()) -> Finding:
+        return Finding(rule, severity, self.section, self.entry, span, tuple(params))
+
+
+@dataclass(frozen=True, slots=True)
+class Rule:
+    name: str
+    target: str
+    check: Callable[[Document], Optional[Finding]]
+    cost: int    # relative cost; cheaper rules run first
+    stop: bool   # when it reports, the target's remaining rules are skipped
+    order: int   # registration order, which is also the order findings are reported in
+
+
+class RuleEngine:
+    """Registry of suggestion rules with per-rule call and time accounting."""
+
+    rules: Dict[str, List[Rule]] = {}
+    stats: Dict[str, List] = {}  # rule name -> [calls, findings, seconds]
+    _lock = threading.Lock()
+
+    @staticmethod
+    def rule(target: str, cost: int = 1, stop: bool = False, name: Optional[str] = None):
+        """Decorator registering a check that returns a ``Finding`` or ``None``."""
+        def register(check):
+            rules = RuleEngine.rules.setdefault(target, [])
+            rule = Rule(name or f"{target}.{check.__name__}", target, check, cost, stop, len(rules))
+            rules.append(rule)
+            rules.sort(key=lambda r: (r.cost, r.order))
+            RuleEngine.stats.setdefault(rule.name, [0, 0, 0.0])
+            return check
+        return register
+
+    @staticmethod
+    def run(target: str, doc: Document) -> List[Finding]:
+        """Runs the target's rules cheapest first and returns findings in registration order."""
+        reported = []
+        timings = []
+        for rule in RuleEngine.rules.get(target, ()):
+            start = time.perf_counter()
+            finding = rule.check(doc)
+            timings.append((rule.name, time.perf_counter() - start, finding is not None))
+            if finding is not None:
+                reported.append((rule.order, finding))
+                if rule.stop:
+                    break
+
+        with RuleEngine._lock:
+            for name, elapsed, fired in timings:
+                stats = RuleEngine.stats[name]
+                stats[0] += 1
+                stats[1] += fired
+                stats[2] += elapsed
+        return [finding for _, finding in sorted(reported, key=lambda item: item[0])]
+
+    @staticmethod
+    def rule_stats() -> List[dict]:
+        """Per-rule counters, most expensive first.
+
+        A rule's time includes building any ``Document`` view it is the first to read.
+        """
+        with RuleEngine._lock:
+            rows = [
+                {
+                    "rule": name,
+                    "calls": calls,
+                    "findings": fired,
+                    "total_ms": seconds * 1000,
+                    "mean_us": seconds / calls * 1e6 if calls else 0.0,
+                }
+                for name, (calls, fired, seconds) in RuleEngine.stats.items()
+            ]
+        return sorted(rows, key=lambda row: row["total_ms"], reverse=True)
+
+    @staticmethod
+    def reset_stats():
+        with RuleEngine._lock:
+            for stats in RuleEngine.stats.values():
+                stats[:] = [0, 0, 0.0]
@@ -0,0 +1,124 @@
+"""Vectorized overall scoring of large resume corpora.
+
+Usage:
+    python -m core.scoring records.jsonl -o scores.csv
+    python -m core.scoring records.csv --below 70
+
+Computes the same 0-100 score as ``SuggestionEngine.analyze_overall_resume``
+without building any feedback markdown. Records are read in chunks; each
+chunk's authored text lines are flattened into one column, features are
+counted column-wise with pandas and the score is combined with NumPy.
+"""
+
+import argparse
+import sys
+from itertools import islice
+from typing import Iterable, Tuple
+import numpy as np
+import pandas as pd
+from core.analysis import METRIC_PATTERN, TextField, iter_text_fields
+from core.lexicon import LexiconRegistry
+from core.records import iter_records
+
+FEATURES = ("has_contact", "has_summary", "has_education", "has_experience",
+            "bullets", "metrics", "verbs", "weak")
+
+# (feature, [(minimum, points), ...]) in descending order, as in analyze_overall_resume
+TIERS = (
+    ("bullets", ((6, 15), (3, 10))),
+    ("metrics", ((5, 20), (2, 12))),
+    ("verbs", ((5, 15), (2, 8))),
+)
+
+
+def extract_features(records: Iterable[Tuple[str, dict]]) -> pd.DataFrame:
+    """Returns one row of scoring features per ``(record_id, data)`` pair."""
+    ids, datas = [], []
+    for record_id, data in records:
+        ids.append(record_id)
+        datas.append(data)
+    count = len(datas)
+    features = pd.DataFrame(index=pd.Index(ids, name="id"))
+    features["has_contact"] = np.fromiter(
+        (bool(d.get("name") and d.get("email")) for d in datas), bool, count)
+    for section in ("summary", "education", "experience"):
+        features[f"has_{section}"] = np.fromiter((bool(d.get(section)) for d in datas), bool, count)
+
+    lines = pd.DataFrame(
+        [(row, *field) for row, d in enumerate(datas) for field in iter_text_fields(d)],
+        columns=["row", *TextField._fields],
+    )
+    is_bullet = (lines["section"] == "experience") & (lines["field"] == "highlights")
+    features["bullets"] = np.bincount(lines["row"][is_bullet], minlength=count)
+
+    # Each distinct line is scanned once, with the whole chunk joined into a
+    # single string per pattern; match offsets are mapped back to lines.
+    codes, texts = pd.factorize(lines["text"])
+    lengths = np.fromiter(map(len, texts), np.int64, len(texts))
+    line_starts = np.cumsum(lengths + 1) - lengths - 1
+    text = "\n".join(texts)
+
+    def text_index(offsets):
+        return np.searchsorted(line_starts, np.asarray(offsets, np.int64), side="right") - 1
+
+    metric_offsets = [m.start() for m in METRIC_PATTERN.finditer(text)]
+    metrics = np.bincount(text_index(metric_offsets), minlength=len(texts))
+    features["metrics"] = np.bincount(lines["row"], weights=metrics[codes], minlength=count).astype(np.int64)
+
+    # Distinct lexicon terms per record, as the engine counts them
+    lexicon = LexiconRegistry.get()
+    found = [(m.start(), m.group(0).casefold()) for m in lexicon.matcher.pattern.finditer(text)]
+    found = pd.DataFrame(found, columns=["offset", "term"])
+    found = pd.DataFrame({"code": text_index(found["offset"]), "term": found["term"]}).drop_duplicates()
+    terms = pd.DataFrame({"row": lines["row"], "code": codes}).merge(found, on="code")
+    terms = terms[["row", "term"]].drop_duplicates()
+    for feature, folded in (("verbs", lexicon.verb_set), ("weak", lexicon.weak_set)):
+        features[feature] = np.bincount(terms["row"][terms["term"].isin(folded)], minlength=count)
+    return features
+
+
+def score_features(features: pd.DataFrame) -> pd.Series:
+    """The 0-100 overall score for each row of ``extract_features`` output."""
+    score = 10 * features[["has_contact", "has_summary", "has_education", "has_experience"]].sum(axis=1)
+    for feature, tiers in TIERS:
+        values = features[feature].to_numpy()
+        score += np.select([values >= minimum for minimum, _ in tiers], [points for _, points in tiers], 0)
+    score += np.where(features["weak"].to_numpy() == 0, 10, 5)
+    return score.rename("score")
+
+
+def score_records(records: Iterable[Tuple[str, dict]], chunk_size: int = 20000) -> pd.DataFrame:
+    """Features and score per record, processed ``chunk_size`` records at a time."""
+    records = iter(records)
+    frames = []
+    while True:
+        chunk = list(islice(records, chunk_size))
+        if not chunk:
+            break
+        features = extract_features(chunk)
+        frames.append(features.assign(score=score_features(features)))
+    if not frames:
+        return pd.DataFrame(columns=[*FEATURES, "score"], index=pd.Index([], name="id"))
+    return pd.concat(frames)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Score resume records without rendering them.")
+    parser.add_argument("input", help="JSONL or CSV file with one resume record per line")
+    parser.add_argument("-o", "--output", default=None, help="CSV file for the scores (default: stdout)")
+    parser.add_argument("--below", type=int, default=None, help="Only keep records scoring below this")
+    parser.add_argument("--chunk-size", type=int, default=20000)
+    args = parser.parse_args(argv)
+
+    def skip(record_id, message):
+        print(f"{record_id}: skipped, {message}", file=sys.stderr)
+
+    scores = score_records(iter_records(args.input, on_error=skip), args.chunk_size)
+    if args.below is not None:
+        scores = scores[scores["score"] < args.below]
+    scores.to_csv(args.output or sys.stdout)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
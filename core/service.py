@@ -0,0 +1,223 @@
+"""Standalone HTTP service for rendering, validating and scoring resumes.
+
+Usage:
+    python -m core.service --port 8600 --workers 4
+
+Endpoints (request bodies are ``form_data`` JSON objects):
+    POST /render?theme=classic&fit_pages=1   -> application/pdf
+    POST /validate                           -> {"valid": bool, "errors": [...]}
+    POST /score?feedback=1                   -> {"score": int, "findings": [...], "feedback": str}
+    GET  /health                             -> queue and coalescing counters
+
+Renders and scores run in a pool of worker processes forked from a warmed-up
+parent, so no request pays the cold-start cost. At most ``--max-pending`` of them
+are queued or running at once; beyond that the service answers 429 with a
+``Retry-After`` header. Identical concurrent render requests are coalesced
+so the PDF is produced once and sent to every caller. Render responses carry
+an ETag, and a matching ``If-None-Match`` is answered with 304 without
+rendering. Bodies that fail validation, are wrongly shaped or lack a field
+the layout needs are answered with 422 and the errors.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import tornado.web
+from tornado.httpserver import HTTPServer
+from core.findings import Report
+from core.generator import MISSING_FIELD, Generator
+from core.lexicon import LexiconRegistry
+from core.suggestions import SuggestionEngine
+from core.themes import DEFAULT_THEME, ThemeRegistry
+from core.validator import ResumeValidator
+from core.warmup import warm_pool
+
+RETRY_AFTER_S = 1
+
+
+def _score(data, feedback=False):
+    score, findings = SuggestionEngine.overall_findings(data)
+    markdown = Report("overall", tuple(findings), score=score).markdown() if feedback else None
+    return score, [f.as_dict() for f in findings], markdown
+
+
+class RenderService:
+    """Process pool with a bounded queue and single-flight render coalescing."""
+
+    def __init__(self, workers=None, max_pending=None):
+        self.workers = workers or os.cpu_count() or 1
+        self.max_pending = max_pending or self.workers * 4
+        self.pool = warm_pool(self.workers)
+        self.pending = 0
+        self.in_flight = {}
+        self.counts = {"rendered": 0, "coalesced": 0, "rejected": 0, "not_modified": 0}
+
+    def full(self):
+        return self.pending >= self.max_pending
+
+    async def run(self, fn, *args):
+        """Runs ``fn`` in the pool; callers must check ``full()`` first."""
+        self.pending += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self.pool, fn, *args)
+        finally:
+            self.pending -= 1
+
+    async def render(self, key, data, theme, fit_pages):
+        """Returns ``(pdf_bytes, error)``, sharing one render among identical requests."""
+        shared = self.in_flight.get(key)
+        if shared is not None:
+            self.counts["coalesced"] += 1
+            return await asyncio.shield(shared)
+
+        shared = asyncio.ensure_future(
+            self.run(Generator.generate_pdf, data, theme, True, None, fit_pages)
+        )
+        self.in_flight[key] = shared
+        shared.add_done_callback(lambda _: self.in_flight.pop(key, None))
+        self.counts["rendered"] += 1
+        return await asyncio.shield(shared)
+
+    def close(self):
+        self.pool.shutdown(wait=False, cancel_futures=True)
+
+
+class BaseHandler(tornado.web.RequestHandler):
+    def initialize(self, service):
+        self.service = service
+
+    def json_body(self):
+        try:
+            data = json.loads(self.request.body or b"{}")
+        except json.JSONDecodeError as e:
+            raise tornado.web.HTTPError(400, reason=f"Invalid JSON: {e.msg}")
+        if not isinstance(data, dict):
+            raise tornado.web.HTTPError(400, reason="Body must be a JSON object")
+        return data
+
+    def reject_if_full(self):
+        if self.service.full():
+            self.service.counts["rejected"] += 1
+            self.set_header("Retry-After", str(RETRY_AFTER_S))
+            raise tornado.web.HTTPError(429, reason="Render queue is full")
+
+    def write_error(self, status_code, **kwargs):
+        self.finish({"error": self._reason})
+
+
+class RenderHandler(BaseHandler):
+    async def post(self):
+        data = self.json_body()
+        theme = self.get_argument("theme", DEFAULT_THEME)
+        if theme not in ThemeRegistry.names():
+            raise tornado.web.HTTPError(400, reason=f"Unknown theme '{theme}'")
+        fit_pages = self.get_argument("fit_pages", None)
+        try:
+            fit_pages = int(fit_pages) if fit_pages else None
+        except ValueError:
+            raise tornado.web.HTTPError(400, reason="fit_pages must be an integer")
+
+        result = ResumeValidator.validate_resume(data)
+        if not result.is_valid:
+            self.set_status(422)
+            self.finish({"errors": [vars(e) for e in result.errors]})
+            return
+
+        etag = Generator.etag(data, theme, fit_pages)
+        self.set_header("ETag", etag)
+        if etag in self.request.headers.get("If-None-Match", ""):
+            self.service.counts["not_modified"] += 1
+            self.set_status(304)
+            return
+
+        if etag not in self.service.in_flight:
+            self.reject_if_full()
+        try:
+            pdf_bytes, error = await self.service.render(etag, data, theme, fit_pages)
+        except Exception as e:  # e.g. a worker crash; answer this request, keep serving
+            pdf_bytes, error = None, f"{type(e).__name__}: {e}"
+        if error:
+            self.clear_header("ETag")
+            self.set_status(422 if error.startswith(MISSING_FIELD) else 500)
+            self.finish({"error": error})
+            return
+
+        self.set_header("Content-Type", "application/pdf")
+        self.set_header("Cache-Control", "private, max-age=0, must-revalidate")
+        self.finish(pdf_bytes)
+
+
+class ValidateHandler(BaseHandler):
+    def post(self):
+        result = ResumeValidator.validate_resume(self.json_body())
+        self.finish({"valid": result.is_valid, "errors": [vars(e) for e in result.errors]})
+
+
+class ScoreHandler(BaseHandler):
+    async def post(self):
+        data = self.json_body()
+        shape = ResumeValidator.validate_shape(data)
+        if not shape.is_valid:
+            self.set_status(422)
+            self.finish({"errors": [vars(e) for e in shape.errors]})
+            return
+        self.reject_if_full()
+        feedback = self.get_query_argument("feedback", "0") == "1"
+        score, findings, markdown = await self.service.run(_score, data, feedback)
+        response = {"score": score, "findings": findings}
+        if feedback:
+            response["feedback"] = markdown
+        self.finish(response)
+
+
+class HealthHandler(BaseHandler):
+    def get(self):
+        self.finish({
+            "workers": self.service.workers,
+            "pending": self.service.pending,
+            "max_pending": self.service.max_pending,
+            **self.service.counts,
+        })
+
+
+def make_app(service):
+    routes = [
+        (r"/render", RenderHandler),
+        (r"/validate", ValidateHandler),
+        (r"/score", ScoreHandler),
+        (r"/health", HealthHandler),
+    ]
+    return tornado.web.Application([(path, handler, {"service": service}) for path, handler in routes])
+
+
+async def serve(port, workers=None, max_pending=None, address="127.0.0.1"):
+    service = RenderService(workers, max_pending)
+    # HTTP/1.1 keep-alive is on by default; idle connections are closed after a minute
+    server = HTTPServer(make_app(service), idle_connection_timeout=60)
+    server.listen(port, address)
+    print(f"Serving on http://{address}:{port} with {service.workers} workers")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        server.stop()
+        service.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve resume rendering over HTTP.")
+    parser.add_argument("--port", type=int, default=8600)
+    parser.add_argument("--address", default="127.0.0.1", help="Interface to bind")
+    parser.add_argument("-w", "--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("--max-pending", type=int, default=None, help="Queued renders before answering 429")
+    parser.add_argument("--lexicon", default=None, help="YAML or JSON lexicon used for scoring")
+    args = parser.parse_args(argv)
+    LexiconRegistry.set_default(args.lexicon)
+    try:
+        asyncio.run(serve(args.port, args.workers, args.max_pending, args.address))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,8 @@
 import streamlit as st
 from streamlit_local_storage import LocalStorage
-from typing import Optional
+from typing import Callable, Optional
+from core.findings import Report, diff_findings
+from core.inline import InlineSuggestions
 
 
 class StateManager:
@@ -16,6 +18,9 @@ class StateManager:
             st.session_state.form_data = {}
         if "visited" not in st.session_state:
             st.session_state.visited = [False] * len(StateManager.STEPS)
+        if "inline_suggestions" not in st.session_state:
+            st.session_state.inline_suggestions = InlineSuggestions()
+        st.session_state.inline_suggestions.start()
 
         stored_data = StateManager.ls.getItem("resume_form_data")
         if stored_data and not st.session_state.form_data:
@@ -86,8 +91,37 @@ class StateManager:
 
     @staticmethod
     @st.dialog("AI Suggestions")
-    def show_suggestions(markdown):
-        st.markdown(markdown)
+    def show_suggestions(report: Report):
+        """Renders a report's findings, noting what changed since the section was last analyzed."""
+        last_findings = st.session_state.setdefault("last_findings", {})
+        previous = last_findings.get(report.section)
+        if previous is not None:
+            added, resolved = diff_findings(previous, report.findings)
+            if added or resolved:
+                st.caption(
+                    f":material/compare_arrows: {len(added)} new, {len(resolved)} resolved since the last analysis"
+                )
+        last_findings[report.section] = report.findings
+        st.markdown(report.markdown())
+
+    @staticmethod
+    def show_inline_suggestions(key: str, text: str, analyze: Callable[[str], list]):
+        """Shows suggestions for one field under it, re-analyzing only when it changed."""
+        if not text.strip():
+            return
+        suggestions, is_stale = st.session_state.inline_suggestions.suggest(key, text, analyze)
+        for suggestion in suggestions or []:
+            st.caption(f":material/lightbulb: {suggestion}")
+        if is_stale:
+            st.caption(":material/autorenew: Checking...")
+            StateManager.refresh_stale_suggestions()
+
+    @staticmethod
+    def refresh_stale_suggestions():
+        """Schedules one follow-up rerun so fields deferred by the budget get analyzed."""
+        if st.session_state.inline_suggestions.deferred == 1:
+            st.session_state.inline_rerun_due = False
+            _rerun_for_stale_suggestions()
 
     @staticmethod
     def remove_item(category: str, index: int):
@@ -103,3 +137,11 @@ class StateManager:
                     StateManager.ls.setItem(
                         "resume_form_data", st.session_state.form_data, key="save_form"
                     )
+
+
+@st.fragment(run_every=0.5)
+def _rerun_for_stale_suggestions():
+    """Reruns the whole page on the fragment's first tick after the page run."""
+    if st.session_state.inline_rerun_due:
+        st.rerun()
+    st.session_state.inline_rerun_due = True
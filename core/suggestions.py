@@ -1,454 +1,302 @@
-import re
 from typing import List, Tuple
-from core.data import ACTION_VERBS, WEAK_WORDS, INDUSTRY_KEYWORDS
+from core.findings import FAIL, INFO, PASS, WARNING, Finding, Report
+from core.lexicon import LexiconRegistry
+from core.rules import Document, RuleEngine
+
+rule = RuleEngine.rule
+
+# Points each overall finding adds to the 0-100 score
+POINTS = {
+    "completeness.contact_present": 10,
+    "completeness.summary_present": 10,
+    "completeness.education_present": 10,
+    "completeness.experience_present": 10,
+    "quality.bullets_strong": 15,
+    "quality.bullets_good": 10,
+    "quality.metrics_excellent": 20,
+    "quality.metrics_good": 12,
+    "language.verbs_strong": 15,
+    "language.verbs_some": 8,
+    "language.no_weak": 10,
+    "language.weak_found": 5,
+}
+
+
+# Professional summary
+
+@rule("summary", cost=1)
+def length(doc):
+    word_count = doc.analysis.word_count
+    if word_count < 20:
+        return doc.finding("summary.too_short", INFO)
+    if word_count > 80:
+        return doc.finding("summary.too_long", INFO)
+
+
+@rule("summary", cost=2)
+def weak_language(doc):
+    weak_found = doc.analysis.weak_phrases
+    if weak_found:
+        first = next(m for m in doc.analysis.matches if m.in_group("weak"))
+        return doc.finding(
+            "summary.weak_language", WARNING, span=(first.start, first.end), params=(", ".join(weak_found[:2]),)
+        )
 
 
-class SuggestionEngine:
-    @staticmethod
-    def analyze_personal_info(data: dict) -> str:
-        suggestions = []
+@rule("summary", cost=1)
+def quantification(doc):
+    if not doc.analysis.has_number:
+        return doc.finding("summary.no_metrics", INFO)
 
-        summary = data.get("summary", "")
-        if summary:
-            summary_suggestions = SuggestionEngine._analyze_summary(summary)
-            if summary_suggestions:
-                suggestions.append("## :material/description: Professional Summary\n")
-                for s in summary_suggestions:
-                    suggestions.append(f"- {s}")
-                suggestions.append("")  # Empty line after section
 
-        title = data.get("title", "")
-        if title and len(title.split()) < 2:
-            suggestions.append("## :material/work: Professional Title\n")
-            suggestions.append(
-                "- Consider making your title more specific (e.g., 'Senior Software Engineer' instead of 'Engineer')"
-            )
-            suggestions.append("")
+@rule("summary", cost=1)
+def first_person(doc):
+    if doc.analysis.first_person:
+        return doc.finding("summary.first_person", WARNING, span=doc.analysis.first_person)
 
-        if not suggestions:
-            return """## :material/check_circle: Personal Info Looks Great!
 
-Your personal information section is well-structured.
+@rule("title", cost=0)
+def vague_title(doc):
+    if doc.analysis.word_count < 2:
+        return doc.finding("title.too_vague", INFO)
 
-**General Tips:**
-- Keep your summary concise (2-3 sentences)
-- Highlight your unique value proposition
-- Include relevant keywords for your industry
-"""
 
-        return "\n".join(suggestions)
+# Education entries; the document text is the entry's highlights
 
-    @staticmethod
-    def _analyze_summary(summary: str) -> List[str]:
-        """Analyze professional summary and return suggestions."""
-        suggestions = []
-
-        words = summary.split()
-        word_count = len(words)
-
-        # Length check
-        if word_count < 20:
-            suggestions.append(
-                "Your summary is quite brief. Aim for 30-60 words to showcase your value"
-            )
-        elif word_count > 80:
-            suggestions.append(
-                "Your summary is a bit long. Try to condense it to 30-60 words for better impact"
-            )
-
-        # Weak language detection
-        weak_found = [w for w in WEAK_WORDS if w.lower() in summary.lower()]
-        if weak_found:
-            suggestions.append(
-                f"Avoid passive phrases like '{', '.join(weak_found[:2])}' - use action-oriented language instead"
-            )
-
-        # Check for quantification
-        if not re.search(r"\d+", summary):
-            suggestions.append(
-                "Add numbers or metrics to quantify your experience (e.g., '5+ years', '20% improvement')"
-            )
-
-        # First-person check
-        first_person = ["I ", "my ", "me "]
-        if any(fp in summary for fp in first_person):
-            suggestions.append(
-                "Write in third person or without pronouns (remove 'I', 'my', 'me')"
-            )
-
-        return suggestions
+@rule("education", cost=0)
+def gpa(doc):
+    if not doc.data.get("gpa", "").strip():
+        return doc.finding("education.no_gpa", INFO)
 
-    @staticmethod
-    def analyze_education(entries: List[dict]) -> str:
-        """Generate suggestions for Education section."""
-        if not entries:
-            return """## :material/school: Education Section is Empty
 
-Education is optional, but adding it can strengthen your resume if:
+@rule("education", cost=1)
+def achievements(doc):
+    if not doc.text:
+        return doc.finding("education.no_highlights", INFO)
+    if doc.analysis.bullet_count < 2:
+        return doc.finding("education.few_highlights", INFO)
 
-- You have relevant degrees or certifications
-- Your education is recent or from a prestigious institution
-- You're a recent graduate or entry-level candidate
-- The role requires specific educational qualifications
 
-**Tip:** For experienced professionals, work experience often matters more than education. You can skip this section if it's not relevant.
-"""
+# Experience entries; the document text is the entry's highlights
 
-        suggestions = []
+@rule("experience", cost=0, stop=True)
+def missing_highlights(doc):
+    if not doc.text:
+        return doc.finding("experience.no_highlights", WARNING)
 
-        for i, edu in enumerate(entries):
-            highlights = edu.get("highlights", "").strip()
-            gpa = edu.get("gpa", "").strip()
 
-            entry_suggestions = []
+@rule("experience", cost=1)
+def bullet_count(doc):
+    if doc.analysis.bullet_count < 2:
+        return doc.finding("highlights.too_few", INFO)
+    if doc.analysis.bullet_count > 6:
+        return doc.finding("highlights.too_many", INFO)
 
-            # GPA suggestion
-            if not gpa:
-                entry_suggestions.append("Consider adding GPA if it's 3.5 or above")
 
-            # Achievements suggestion
-            if not highlights:
-                entry_suggestions.append(
-                    "Add relevant achievements, honors, or coursework"
-                )
-            elif len(highlights.split("\n")) < 2:
-                entry_suggestions.append(
-                    "Add more specific achievements (awards, projects, relevant coursework)"
-                )
+@rule("experience", cost=3)
+def action_verb_start(doc):
+    bullets = doc.analysis.bullet_count
+    if bullets - doc.analysis.verb_bullets > bullets / 2:
+        example_verbs = ", ".join(LexiconRegistry.get().verbs_for("technical")[:3])
+        return doc.finding("highlights.weak_verbs", WARNING, params=(example_verbs,))
 
-            if entry_suggestions:
-                suggestions.append(
-                    f"## :material/school: Education #{i+1}: {edu.get('degree', 'Entry')}\n"
-                )
-                for s in entry_suggestions:
-                    suggestions.append(f"- {s}")
-                suggestions.append("")
 
-        if not suggestions:
-            return """## :material/check_circle: Education Section Looks Strong!
+@rule("experience", cost=3)
+def bullet_quantification(doc):
+    bullets = doc.analysis.bullet_count
+    if bullets - doc.analysis.number_bullets > bullets / 2:
+        return doc.finding("highlights.no_metrics", INFO)
 
-Your education entries are well-detailed with good information."""
 
-        return "\n".join(suggestions)
+@rule("experience", cost=3)
+def bullet_weak_language(doc):
+    if doc.analysis.weak_phrases:
+        return doc.finding("highlights.weak_language", WARNING)
 
-    @staticmethod
-    def analyze_experience(entries: List[dict]) -> str:
-        """Generate suggestions for Work Experience section."""
-        if not entries:
-            return """## :material/work: Work Experience Missing
 
-Add work experience to showcase your professional background.
+# Project entries; the document text is the description
 
-**What to Include:**
-- Company name and position title
-- Employment dates
-- Key achievements and responsibilities
-- Quantifiable results and metrics
-"""
+@rule("projects", cost=2)
+def description(doc):
+    if not doc.text:
+        return doc.finding("project.no_description", WARNING)
+    if doc.analysis.word_count < 10:
+        return doc.finding("project.short_description", INFO)
 
-        suggestions = []
 
-        for i, exp in enumerate(entries):
-            highlights = exp.get("highlights", "").strip()
+@rule("projects", cost=0)
+def url(doc):
+    if not doc.data.get("url", "").strip():
+        return doc.finding("project.no_url", INFO)
 
-            if not highlights:
-                suggestions.append(
-                    f"## :material/work: Experience #{i+1}: {exp.get('position', 'Entry')}\n"
-                )
-                suggestions.append("- Add key achievements and responsibilities")
-                suggestions.append("")
-                continue
 
-            entry_suggestions = SuggestionEngine._analyze_highlights(highlights)
+@rule("projects", cost=2)
+def keyword_coverage(doc):
+    if doc.text and not doc.analysis.keywords:
+        return doc.finding("project.no_skills", INFO)
 
-            if entry_suggestions:
-                suggestions.append(
-                    f"## :material/work: {exp.get('position', 'Position')} at {exp.get('company', 'Company')}\n"
-                )
-                for s in entry_suggestions:
-                    suggestions.append(f"- {s}")
-                suggestions.append("")
 
-        if not suggestions:
-            return """## :material/check_circle: Experience Section is Strong!
+# Whole resume; each rule reports a pass, warning or fail that POINTS scores
 
-Your work experience is well-documented with achievements."""
+@rule("overall", cost=0)
+def contact(doc):
+    if doc.data.get("name") and doc.data.get("email"):
+        return doc.finding("completeness.contact_present", PASS)
+    return doc.finding("completeness.contact_missing", FAIL)
 
-        return "\n".join(suggestions)
 
-    @staticmethod
-    def _analyze_highlights(highlights: str) -> List[str]:
-        """Analyze achievement highlights and return suggestions."""
-        suggestions = []
-
-        bullets = [b.strip() for b in highlights.split("\n") if b.strip()]
-
-        # Check number of bullets
-        if len(bullets) < 2:
-            suggestions.append("Add more bullet points (aim for 3-5 key achievements)")
-        elif len(bullets) > 6:
-            suggestions.append("Consider condensing to 4-6 most impactful achievements")
-
-        # Analyze each bullet
-        bullets_without_action_verbs = 0
-        bullets_without_numbers = 0
-        bullets_with_weak_language = 0
-
-        all_action_verbs = [v for verbs in ACTION_VERBS.values() for v in verbs]
-
-        for bullet in bullets:
-            words = bullet.split()
-            if not words:
-                continue
-
-            # Check for action verb
-            first_word = words[0].rstrip(".,;:")
-            if first_word not in all_action_verbs:
-                bullets_without_action_verbs += 1
-
-            # Check for quantification
-            if not re.search(r"\d+", bullet):
-                bullets_without_numbers += 1
-
-            # Check for weak language
-            if any(weak in bullet.lower() for weak in WEAK_WORDS):
-                bullets_with_weak_language += 1
-
-        # Generate suggestions based on analysis
-        if bullets_without_action_verbs > len(bullets) / 2:
-            example_verbs = ", ".join(ACTION_VERBS["technical"][:3])
-            suggestions.append(
-                f"Start more bullets with strong action verbs (e.g., {example_verbs})"
-            )
-
-        if bullets_without_numbers > len(bullets) / 2:
-            suggestions.append(
-                "Add metrics and numbers to quantify your impact (e.g., 'Increased efficiency by 30%')"
-            )
-
-        if bullets_with_weak_language > 0:
-            suggestions.append(
-                "Remove passive phrases like 'responsible for' - be direct and action-oriented"
-            )
-
-        return suggestions
+def _section_present(section):
+    def check(doc):
+        if doc.data.get(section):
+            return doc.finding(f"completeness.{section}_present", PASS)
+        return doc.finding(f"completeness.{section}_missing", FAIL)
+    return check
 
-    @staticmethod
-    def analyze_projects(entries: List[dict]) -> str:
-        """Generate suggestions for Projects section."""
-        if not entries:
-            return """## :material/rocket_launch: Projects Section is Optional
 
-Projects are optional but can strengthen your resume, especially for technical roles.
+for _section in ("summary", "education", "experience"):
+    rule("overall", cost=0, name=f"overall.{_section}")(_section_present(_section))
 
-**Consider adding projects if:**
-- You have notable side projects or open source contributions
-- You're a recent graduate or transitioning careers
-- You want to showcase specific technical skills
-- You have limited professional experience
-"""
 
-        suggestions = []
+@rule("overall", cost=2)
+def detail(doc):
+    bullets = doc.totals.bullets
+    if bullets >= 6:
+        return doc.finding("quality.bullets_strong", PASS, params=(bullets,))
+    if bullets >= 3:
+        return doc.finding("quality.bullets_good", WARNING, params=(bullets,))
+    return doc.finding("quality.bullets_few", FAIL)
 
-        for i, proj in enumerate(entries):
-            desc = proj.get("description", "").strip()
-            url = proj.get("url", "").strip()
-
-            entry_suggestions = []
-
-            if not desc:
-                entry_suggestions.append(
-                    "Add a description of the project and your contributions"
-                )
-            elif len(desc.split()) < 10:
-                entry_suggestions.append(
-                    "Expand description to include technologies used and impact"
-                )
-
-            if not url:
-                entry_suggestions.append(
-                    "Add a URL if the project is publicly available (GitHub, live demo, etc.)"
-                )
-
-            # Check for technologies/skills
-            if desc and not any(
-                keyword in desc.lower()
-                for keywords in INDUSTRY_KEYWORDS.values()
-                for keyword in keywords
-            ):
-                entry_suggestions.append("Mention specific technologies or skills used")
-
-            if entry_suggestions:
-                suggestions.append(
-                    f"## :material/rocket_launch: Project #{i+1}: {proj.get('name', 'Entry')}\n"
-                )
-                for s in entry_suggestions:
-                    suggestions.append(f"- {s}")
-                suggestions.append("")
-
-        if not suggestions:
-            return """## :material/check_circle: Projects Section Looks Great!
-
-Your projects are well-documented with good descriptions."""
-
-        return "\n".join(suggestions)
+
+@rule("overall", cost=2)
+def metrics(doc):
+    count = doc.totals.metrics
+    if count >= 5:
+        return doc.finding("quality.metrics_excellent", PASS, params=(count,))
+    if count >= 2:
+        return doc.finding("quality.metrics_good", WARNING, params=(count,))
+    return doc.finding("quality.metrics_few", FAIL)
+
+
+@rule("overall", cost=2)
+def action_verbs(doc):
+    count = len(doc.totals.verbs)
+    if count >= 5:
+        return doc.finding("language.verbs_strong", PASS)
+    if count >= 2:
+        return doc.finding("language.verbs_some", WARNING)
+    return doc.finding("language.verbs_few", FAIL)
+
+
+@rule("overall", cost=2)
+def passive_language(doc):
+    if not doc.totals.weak:
+        return doc.finding("language.no_weak", PASS)
+    return doc.finding("language.weak_found", WARNING, params=(len(doc.totals.weak),))
+
+
+class SuggestionEngine:
+    """Resume checks that return ``Finding`` objects.
+
+    The checks themselves are the rules registered above; the ``*_findings``
+    methods run them per field or entry, and the ``analyze_*`` methods
+    render their findings to markdown for callers that want text.
+    """
 
     @staticmethod
-    def analyze_overall_resume(form_data: dict) -> Tuple[int, str]:
-        """
-        Analyze the complete resume and return a score (0-100) and detailed feedback.
+    def analyze_personal_info(data: dict) -> str:
+        return Report("personal", tuple(SuggestionEngine.personal_info_findings(data))).markdown()
 
-        Returns:
-            Tuple[int, str]: (score, formatted_feedback_markdown)
-        """
-        score = 0
-        feedback_sections = []
+    @staticmethod
+    def personal_info_findings(data: dict) -> List[Finding]:
+        findings = []
 
-        # Header
-        feedback_sections.append("# :material/analytics: Resume Strength Analysis\n")
+        summary = data.get("summary", "")
+        if summary:
+            findings += RuleEngine.run("summary", Document("personal", summary))
 
-        # Completeness Score (40 points)
-        feedback_sections.append("## :material/checklist: Resume Completeness\n")
-        completeness_items = []
+        title = data.get("title", "")
+        if title:
+            findings += RuleEngine.run("title", Document("personal", title))
 
-        if form_data.get("name") and form_data.get("email"):
-            score += 10
-            completeness_items.append("- :material/check: Contact information present")
-        else:
-            completeness_items.append("- :material/close: Missing contact information")
+        return findings
 
-        if form_data.get("summary"):
-            score += 10
-            completeness_items.append(
-                "- :material/check: Professional summary included"
-            )
+    @staticmethod
+    def analyze_field(field: str, text: str) -> List[str]:
+        """Suggestions for a single summary or highlights field, for inline display."""
+        text = text.strip()
+        if not text:
+            return []
+        if field == "summary":
+            findings = RuleEngine.run("summary", Document("personal", text))
         else:
-            completeness_items.append("- :material/close: Add a professional summary")
+            findings = RuleEngine.run("experience", Document("experience", text))
+        return [f.message for f in findings]
 
-        if form_data.get("education"):
-            score += 10
-            completeness_items.append("- :material/check: Education section filled")
-        else:
-            completeness_items.append(
-                "- :material/close: Add education details (optional)"
-            )
+    @staticmethod
+    def analyze_education(entries: List[dict]) -> str:
+        """Generate suggestions for Education section."""
+        return Report("education", tuple(SuggestionEngine.education_findings(entries)), entries).markdown()
 
-        if form_data.get("experience"):
-            score += 10
-            completeness_items.append("- :material/check: Work experience included")
-        else:
-            completeness_items.append("- :material/close: Add work experience")
-
-        feedback_sections.append("\n".join(completeness_items))
-        feedback_sections.append("")
-
-        # Content Quality Score (35 points)
-        feedback_sections.append("## :material/star: Content Quality\n")
-        quality_items = []
-
-        # Count achievement bullets
-        total_bullets = 0
-        if form_data.get("experience"):
-            for exp in form_data["experience"]:
-                highlights = exp.get("highlights", "")
-                total_bullets += len([b for b in highlights.split("\n") if b.strip()])
-
-        if total_bullets >= 6:
-            score += 15
-            quality_items.append(
-                f"- :material/check: Strong detail level ({total_bullets} achievement bullets)"
-            )
-        elif total_bullets >= 3:
-            score += 10
-            quality_items.append(
-                f"- :material/warning: Good detail, consider adding more achievements ({total_bullets} bullets)"
-            )
-        else:
-            quality_items.append(
-                "- :material/close: Add more specific achievements and responsibilities"
-            )
-
-        # Check for quantification
-        all_text = str(form_data)
-        numbers_count = len(re.findall(r"\d+%|\d+x|\$\d+|\d+\+", all_text))
-
-        if numbers_count >= 5:
-            score += 20
-            quality_items.append(
-                f"- :material/check: Excellent use of metrics ({numbers_count} quantified achievements)"
-            )
-        elif numbers_count >= 2:
-            score += 12
-            quality_items.append(
-                f"- :material/warning: Good metrics usage, add more numbers ({numbers_count} found)"
-            )
-        else:
-            quality_items.append(
-                "- :material/close: Add metrics and numbers to quantify your impact"
-            )
+    @staticmethod
+    def education_findings(entries: List[dict]) -> List[Finding]:
+        findings = []
+        for i, edu in enumerate(entries):
+            doc = Document("education", edu.get("highlights", "").strip(), edu, i)
+            findings += RuleEngine.run("education", doc)
+        return findings
 
-        feedback_sections.append("\n".join(quality_items))
-        feedback_sections.append("")
+    @staticmethod
+    def analyze_experience(entries: List[dict]) -> str:
+        """Generate suggestions for Work Experience section."""
+        return Report("experience", tuple(SuggestionEngine.experience_findings(entries)), entries).markdown()
 
-        # Action Verbs & Language (25 points)
-        feedback_sections.append("## :material/edit: Language & Impact\n")
-        language_items = []
+    @staticmethod
+    def experience_findings(entries: List[dict]) -> List[Finding]:
+        findings = []
+        for i, exp in enumerate(entries):
+            doc = Document("experience", exp.get("highlights", "").strip(), exp, i)
+            findings += RuleEngine.run("experience", doc)
+        return findings
 
-        all_action_verbs = [v for verbs in ACTION_VERBS.values() for v in verbs]
-        action_verb_count = sum(
-            1 for verb in all_action_verbs if verb.lower() in all_text.lower()
-        )
+    @staticmethod
+    def analyze_projects(entries: List[dict]) -> str:
+        """Generate suggestions for Projects section."""
+        return Report("projects", tuple(SuggestionEngine.project_findings(entries)), entries).markdown()
 
-        if action_verb_count >= 5:
-            score += 15
-            language_items.append("- :material/check: Strong use of action verbs")
-        elif action_verb_count >= 2:
-            score += 8
-            language_items.append(
-                "- :material/warning: Add more action verbs to strengthen impact"
-            )
-        else:
-            language_items.append(
-                "- :material/close: Start bullets with action verbs (Led, Developed, Achieved, etc.)"
-            )
-
-        # Check for weak language
-        weak_count = sum(1 for weak in WEAK_WORDS if weak.lower() in all_text.lower())
-        if weak_count == 0:
-            score += 10
-            language_items.append("- :material/check: No passive language detected")
-        else:
-            score += 5
-            language_items.append(
-                f"- :material/warning: Remove {weak_count} instances of passive phrases"
-            )
-
-        feedback_sections.append("\n".join(language_items))
-        feedback_sections.append("")
-
-        # Overall Rating
-        feedback_sections.append("---\n")
-        feedback_sections.append(f"## Overall Score: **{score}/100**\n")
-
-        if score >= 85:
-            rating = ":material/star: **Excellent** - Your resume is strong and ready!"
-        elif score >= 70:
-            rating = (
-                ":material/thumb_up: **Good** - Minor improvements will make it great"
-            )
-        elif score >= 50:
-            rating = ":material/warning: **Fair** - Needs some work to stand out"
-        else:
-            rating = ":material/build: **Needs Improvement** - Focus on the suggestions above"
+    @staticmethod
+    def project_findings(entries: List[dict]) -> List[Finding]:
+        findings = []
+        for i, proj in enumerate(entries):
+            doc = Document("projects", proj.get("description", "").strip(), proj, i)
+            findings += RuleEngine.run("projects", doc)
+        return findings
 
-        feedback_sections.append(rating)
+    @staticmethod
+    def analyze_overall_resume(form_data: dict) -> Tuple[int, str]:
+        """
+        Analyze the complete resume and return a score (0-100) and detailed feedback.
 
-        return score, "\n".join(feedback_sections)
+        Returns:
+            Tuple[int, str]: (score, formatted_feedback_markdown)
+        """
+        score, findings = SuggestionEngine.overall_findings(form_data)
+        return score, Report("overall", tuple(findings), score=score).markdown()
+
+    @staticmethod
+    def overall_findings(form_data: dict) -> Tuple[int, List[Finding]]:
+        """Returns the 0-100 score and one pass/warning/fail finding per check."""
+        findings = RuleEngine.run("overall", Document("overall", data=form_data))
+        return sum(POINTS.get(f.rule, 0) for f in findings), findings
+
+    @staticmethod
+    def resume_totals(form_data: dict):
+        """Bullet, metric, action verb and weak phrase counts over the authored text."""
+        return Document("overall", data=form_data).totals
 
     @staticmethod
     def suggest_action_verbs(category: str = "technical") -> List[str]:
         """Return a list of action verbs for a specific category."""
-        return ACTION_VERBS.get(category, ACTION_VERBS["technical"])
+        return list(LexiconRegistry.get().verbs_for(category))
 
     @staticmethod
     def get_industry_specific_tips(industry: str) -> str:
@@ -0,0 +1,137 @@
+import threading
+from dataclasses import dataclass
+from types import MappingProxyType
+from reportlab.lib import colors
+from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from core.cache import content_hash
+
+DEFAULT_THEME = "classic"
+
+THEMES = {
+    "classic": {
+        "title": "#2C3E50",
+        "subtitle": "#7F8C8D",
+        "heading": "#2980B9",
+        "rule": "#BDC3C7",
+        "sidebar_bg": "#2C3E50",
+        "sidebar_text": "#F5F5F5",
+        "font": "Helvetica",
+        "font_bold": "Helvetica-Bold",
+    },
+    "modern": {
+        "title": "#111827",
+        "subtitle": "#6B7280",
+        "heading": "#0F766E",
+        "rule": "#D1D5DB",
+        "sidebar_bg": "#134E4A",
+        "sidebar_text": "#F0FDFA",
+        "font": "Helvetica",
+        "font_bold": "Helvetica-Bold",
+    },
+    "executive": {
+        "title": "#1F2937",
+        "subtitle": "#4B5563",
+        "heading": "#7C2D12",
+        "rule": "#D6D3D1",
+        "sidebar_bg": "#292524",
+        "sidebar_text": "#FAFAF9",
+        "font": "Times-Roman",
+        "font_bold": "Times-Bold",
+    },
+    "mono": {
+        "title": "#000000",
+        "subtitle": "#404040",
+        "heading": "#000000",
+        "rule": "#A3A3A3",
+        "sidebar_bg": "#262626",
+        "sidebar_text": "#FFFFFF",
+        "font": "Helvetica",
+        "font_bold": "Helvetica-Bold",
+    },
+}
+
+
+@dataclass(frozen=True)
+class Theme:
+    """Styles and colours compiled once per process for a theme."""
+
+    name: str
+    version: str
+    colors: MappingProxyType
+    styles: MappingProxyType
+    scale: float = 1.0
+
+
+class ThemeRegistry:
+    _compiled = {}
+    _lock = threading.Lock()
+
+    @staticmethod
+    def names():
+        return list(THEMES)
+
+    @staticmethod
+    def get(name=DEFAULT_THEME, scale=1.0) -> Theme:
+        """Returns the compiled theme, compiling it on first use.
+
+        ``scale`` shrinks or grows font sizes, leading and spacing together.
+        """
+        key = (name, scale)
+        theme = ThemeRegistry._compiled.get(key)
+        if theme is not None:
+            return theme
+        if name not in THEMES:
+            raise KeyError(f"Unknown theme '{name}'. Available: {', '.join(THEMES)}")
+        with ThemeRegistry._lock:
+            theme = ThemeRegistry._compiled.get(key)
+            if theme is None:
+                theme = ThemeRegistry._compile(name, THEMES[name], scale)
+                ThemeRegistry._compiled[key] = theme
+        return theme
+
+    @staticmethod
+    def _compile(name, spec, scale=1.0) -> Theme:
+        base = getSampleStyleSheet()
+        palette = {
+            key: colors.HexColor(value)
+            for key, value in spec.items()
+            if value.startswith("#")
+        }
+
+        styles = {
+            "title": ParagraphStyle(
+                f"{name}.Name", parent=base["Heading1"], fontName=spec["font_bold"],
+                fontSize=24, textColor=palette["title"], spaceAfter=2
+            ),
+            "subtitle": ParagraphStyle(
+                f"{name}.Sub", parent=base["Normal"], fontName=spec["font"],
+                fontSize=12, textColor=palette["subtitle"], spaceAfter=10
+            ),
+            "section_header": ParagraphStyle(
+                f"{name}.SectionHeader", parent=base["Heading2"], fontName=spec["font_bold"],
+                fontSize=14, textColor=palette["heading"], spaceBefore=10, spaceAfter=5
+            ),
+            "body": ParagraphStyle(
+                f"{name}.Body", parent=base["Normal"], fontName=spec["font"],
+                fontSize=10, leading=12, alignment=0
+            ),
+            "sidebar": ParagraphStyle(
+                f"{name}.Sidebar", parent=base["Normal"], fontName=spec["font"],
+                fontSize=9, textColor=palette["sidebar_text"], leading=11
+            ),
+        }
+
+        if scale != 1.0:
+            for style in styles.values():
+                style.fontSize *= scale
+                style.leading *= scale
+                style.spaceBefore *= scale
+                style.spaceAfter *= scale
+
+        return Theme(
+            name=name,
+            version=content_hash(name, spec, scale),
+            colors=MappingProxyType(palette),
+            styles=MappingProxyType(styles),
+            scale=scale,
+        )
@@ -0,0 +1,134 @@
+import json
+import threading
+import typst
+from core.themes import DEFAULT_THEME, THEMES
+
+TEMPLATES = {
+    "classic": r"""
+#let data = json(bytes(sys.inputs.data))
+#let palette = json(bytes(sys.inputs.palette))
+#let c(key) = rgb(palette.at(key))
+
+#set document(
+  title: data.at("name", default: "Resume"),
+  date: if sys.inputs.deterministic == "1" { none } else { auto },
+)
+#set page(paper: "a4", margin: 1cm)
+#set text(font: "Libertinus Serif", size: 10pt)
+#set par(leading: 0.45em)
+
+#let heading-text(title) = block(above: 10pt, below: 5pt)[
+  #text(size: 14pt, weight: "bold", fill: c("heading"))[#title]
+]
+#let lines(value) = value.split("\n").filter(l => l.trim() != "").join(linebreak())
+
+#block(below: 8pt, text(size: 24pt, weight: "bold", fill: c("title"))[
+  #upper(data.at("name", default: "Applicant"))
+])
+#text(size: 12pt, fill: c("subtitle"))[#data.at("title", default: "")]
+#line(length: 100%, stroke: 1pt + c("rule"))
+#v(10pt)
+
+#let sidebar = {
+  set text(size: 9pt, fill: c("sidebar_text"))
+  [*CONTACT*]
+  v(0.2cm)
+  for key in ("email", "phone", "location") [
+    #data.at(key, default: "") \
+  ]
+  for section in data.at("custom_sections", default: ()) {
+    v(0.5cm)
+    [*#upper(section.title)*]
+    v(0.2cm)
+    lines(section.content)
+  }
+}
+
+#let main = {
+  if data.at("summary", default: "") != "" {
+    heading-text[PROFESSIONAL SUMMARY]
+    data.summary
+  }
+  let experience = data.at("experience", default: ())
+  if experience.len() > 0 {
+    heading-text[WORK EXPERIENCE]
+    for exp in experience {
+      [*#exp.position* | #exp.company \ ]
+      emph[#exp.start_date — #exp.end_date]
+      linebreak()
+      lines(exp.at("highlights", default: ""))
+      v(0.3cm)
+    }
+  }
+  let education = data.at("education", default: ())
+  if education.len() > 0 {
+    heading-text[EDUCATION]
+    for edu in education {
+      [*#edu.degree*, #edu.institution \ ]
+      emph[#edu.start_date — #edu.end_date]
+      v(0.2cm)
+    }
+  }
+}
+
+#grid(
+  columns: (5.5cm, 1fr),
+  inset: (x: 10pt, top: 6pt, bottom: 20pt),
+  fill: (x, y) => if x == 0 { c("sidebar_bg") },
+  sidebar, main,
+)
+""",
+}
+
+
+class TypstGenerator:
+    """Renders resumes with an in-process Typst compiler.
+
+    Compilers (with their parsed template and loaded fonts) are created once
+    per process and reused; the resume data is passed via ``sys.inputs``.
+    """
+
+    _compilers = {}
+    _locks = {}
+    _lock = threading.Lock()
+
+    @staticmethod
+    def _compiler(template):
+        compiler = TypstGenerator._compilers.get(template)
+        if compiler is None:
+            with TypstGenerator._lock:
+                compiler = TypstGenerator._compilers.get(template)
+                if compiler is None:
+                    compiler = typst.Compiler(ignore_system_fonts=True)
+                    TypstGenerator._locks[template] = threading.Lock()
+                    TypstGenerator._compilers[template] = compiler
+        return compiler, TypstGenerator._locks[template]
+
+    @staticmethod
+    def generate_pdf(data, theme=DEFAULT_THEME, template="classic", deterministic=True):
+        """Returns ``(pdf_bytes, error)`` like ``Generator.generate_pdf``.
+
+        With ``deterministic`` the PDF carries no creation date, so identical
+        input always compiles to identical bytes.
+        """
+        if template not in TEMPLATES:
+            return None, f"Unknown Typst template '{template}'. Available: {', '.join(TEMPLATES)}"
+        if theme not in THEMES:
+            return None, f"Unknown theme '{theme}'. Available: {', '.join(THEMES)}"
+
+        compiler, lock = TypstGenerator._compiler(template)
+        sys_inputs = {
+            "data": json.dumps(data, default=str, sort_keys=True),
+            "palette": json.dumps(THEMES[theme]),
+            "deterministic": "1" if deterministic else "0",
+        }
+        try:
+            with lock:
+                pdf_bytes = compiler.compile(
+                    input=TEMPLATES[template].encode("utf-8"),
+                    format="pdf",
+                    sys_inputs=sys_inputs,
+                )
+            return pdf_bytes, None
+        except typst.TypstError as e:
+            return None, e.message
@@ -1,8 +1,12 @@
 import re
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from typing import List, Optional, Any
 
 
+# form_data keys holding lists of entry dicts
+ENTRY_SECTIONS = ("experience", "education", "projects", "custom_sections")
+
+
 @dataclass
 class PersonalInfo:
     name: str
@@ -190,3 +194,40 @@ class ResumeValidator:
                 FieldError("skills", "Please add at least one skill category.")
             )
         return ValidationResult(is_valid=len(errors) == 0, errors=errors)
+
+    @classmethod
+    def validate_shape(cls, data: dict) -> ValidationResult:
+        """Checks that text fields are strings and entry sections are lists of objects."""
+        errors = []
+        for key in (f.name for f in fields(PersonalInfo)):
+            if data.get(key) is not None and not isinstance(data[key], str):
+                errors.append(FieldError(key, f"'{key}' must be a string."))
+        for key in ENTRY_SECTIONS:
+            entries = data.get(key)
+            if entries is None:
+                continue
+            if not isinstance(entries, list) or not all(isinstance(e, dict) for e in entries):
+                errors.append(FieldError(key, f"'{key}' must be a list of objects."))
+        return ValidationResult(is_valid=len(errors) == 0, errors=errors)
+
+    @classmethod
+    def validate_resume(cls, data: dict) -> ValidationResult:
+        """Validates a complete form_data record, e.g. for headless rendering."""
+        shape = cls.validate_shape(data)
+        if not shape.is_valid:
+            return shape
+        optional = {f.name for f in fields(PersonalInfo)} - {"name", "email"}
+        info = PersonalInfo(
+            name=data.get("name", ""),
+            email=data.get("email", ""),
+            **{key: data.get(key) for key in optional},
+        )
+        errors = []
+        for result in (
+            cls.validate_personal_info(info),
+            cls.validate_education(data.get("education", [])),
+            cls.validate_experience(data.get("experience", [])),
+            cls.validate_projects(data.get("projects", [])),
+        ):
+            errors.extend(result.errors)
+        return ValidationResult(is_valid=len(errors) == 0, errors=errors)
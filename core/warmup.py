@@ -0,0 +1,73 @@
+import gc
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from core.generator import Generator
+from core.lexicon import LexiconRegistry
+from core.themes import ThemeRegistry
+
+WARMUP_RESUME = {
+    "name": "Warm Up",
+    "title": "Render Check",
+    "email": "warm.up@example.com",
+    "phone": "+1 555 000 0000",
+    "location": "Nowhere",
+    "summary": "Exercises every <b>section</b> and <i>font</i> once.",
+    "experience": [{
+        "position": "Engineer", "company": "Example", "start_date": "2020-01-01",
+        "end_date": "2021-01-01", "highlights": "First line\nSecond line",
+    }],
+    "education": [{
+        "degree": "BSc", "institution": "Example University",
+        "start_date": "2016-09-01", "end_date": "2020-06-01",
+    }],
+    "custom_sections": [{"title": "Skills", "content": "Python\nreportlab"}],
+}
+
+
+def warm_up(themes=None):
+    """Compiles themes and renders a throwaway resume once per theme.
+
+    This pays for reportlab's lazy imports, font metrics and style building
+    up front, so the first real request does not. The lexicon matcher is
+    compiled too. Returns timings in ms.
+    """
+    start = time.perf_counter()
+    LexiconRegistry.get().matcher.findall(WARMUP_RESUME["summary"])
+    timings = {"lexicon": (time.perf_counter() - start) * 1000}
+    for name in themes or ThemeRegistry.names():
+        start = time.perf_counter()
+        _, error = Generator.generate_pdf(WARMUP_RESUME, theme=name, use_cache=False)
+        if error:
+            raise RuntimeError(f"Warm-up render failed for theme '{name}': {error}")
+        timings[name] = (time.perf_counter() - start) * 1000
+    return timings
+
+
+def fork_context():
+    """Returns the ``fork`` context where the platform has it, else the default."""
+    if "fork" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("fork")
+    return multiprocessing.get_context()
+
+
+def _ready():
+    return os.getpid()
+
+
+def warm_pool(max_workers):
+    """Warms this process and returns a pool whose workers are forked from it.
+
+    Workers start already holding the imported modules, fonts and compiled
+    themes, shared copy-on-write with the parent. ``gc.freeze`` moves the
+    warmed objects out of the collector's reach so collections in the
+    workers do not touch (and copy) those pages. All workers are forked
+    immediately rather than on the first request.
+    """
+    warm_up()
+    gc.freeze()
+    pool = ProcessPoolExecutor(max_workers=max_workers, mp_context=fork_context())
+    for future in [pool.submit(_ready) for _ in range(max_workers)]:
+        future.result()
+    return pool
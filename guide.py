@@ -1,239 +1,15 @@
 import streamlit as st
 import yaml
-import os
-import subprocess
 import re
+from core.findings import PASS
+from core.inline import InlineSuggestions
+from core.rendercv_pool import RenderCVPool
+from core.smanager import StateManager
+from core.suggestions import SuggestionEngine
 
 
 class EnhancedResumeNLP:
-    ACTION_VERBS = {
-        "leadership": [
-            "Led",
-            "Directed",
-            "Managed",
-            "Supervised",
-            "Coordinated",
-            "Orchestrated",
-            "Spearheaded",
-            "Mentored",
-            "Guided",
-            "Facilitated",
-        ],
-        "technical": [
-            "Developed",
-            "Engineered",
-            "Programmed",
-            "Designed",
-            "Architected",
-            "Built",
-            "Implemented",
-            "Coded",
-            "Debugged",
-            "Optimized",
-        ],
-        "analytical": [
-            "Analyzed",
-            "Evaluated",
-            "Assessed",
-            "Investigated",
-            "Researched",
-            "Examined",
-            "Audited",
-            "Measured",
-            "Calculated",
-            "Forecasted",
-        ],
-        "creative": [
-            "Designed",
-            "Created",
-            "Conceptualized",
-            "Innovated",
-            "Invented",
-            "Crafted",
-            "Produced",
-            "Authored",
-            "Illustrated",
-            "Composed",
-        ],
-        "improvement": [
-            "Improved",
-            "Enhanced",
-            "Optimized",
-            "Streamlined",
-            "Upgraded",
-            "Revamped",
-            "Transformed",
-            "Modernized",
-            "Automated",
-            "Refined",
-        ],
-        "achievement": [
-            "Achieved",
-            "Accomplished",
-            "Delivered",
-            "Exceeded",
-            "Surpassed",
-            "Attained",
-            "Completed",
-            "Earned",
-            "Won",
-            "Secured",
-        ],
-    }
-
-    # Common weak words to avoid
-    WEAK_WORDS = [
-        "responsible for",
-        "duties included",
-        "worked on",
-        "helped with",
-        "assisted with",
-        "participated in",
-        "involved in",
-        "was part of",
-    ]
-
-    # Keywords for different industries
-    INDUSTRY_KEYWORDS = {
-        "software": [
-            "agile",
-            "scrum",
-            "CI/CD",
-            "microservices",
-            "API",
-            "cloud",
-            "testing",
-            "deployment",
-            "DevOps",
-            "git",
-            "docker",
-            "kubernetes",
-        ],
-        "data": [
-            "machine learning",
-            "data analysis",
-            "SQL",
-            "Python",
-            "statistics",
-            "visualization",
-            "ETL",
-            "big data",
-            "ML models",
-            "algorithms",
-        ],
-        "product": [
-            "roadmap",
-            "stakeholders",
-            "user research",
-            "product strategy",
-            "metrics",
-            "A/B testing",
-            "KPIs",
-            "market analysis",
-            "user stories",
-        ],
-        "marketing": [
-            "campaigns",
-            "ROI",
-            "analytics",
-            "SEO",
-            "content strategy",
-            "social media",
-            "conversion",
-            "engagement",
-            "branding",
-            "growth",
-        ],
-    }
-
-    @staticmethod
-    def suggest_action_verb(text, category="technical"):
-        """Suggest an appropriate action verb based on context"""
-        if not text:
-            return None
-
-        words = text.lower().split()
-        first_word = words[0] if words else ""
-
-        # Check if starts with action verb
-        all_verbs = [
-            v for verbs in EnhancedResumeNLP.ACTION_VERBS.values() for v in verbs
-        ]
-        if first_word.capitalize() in all_verbs:
-            return None
-
-        # Suggest a verb from the category
-        return EnhancedResumeNLP.ACTION_VERBS.get(
-            category, EnhancedResumeNLP.ACTION_VERBS["technical"]
-        )[0]
-
-    @staticmethod
-    def detect_weak_language(text):
-        """Detect weak language in resume text"""
-        if not text:
-            return []
-
-        text_lower = text.lower()
-        found_weak = []
-
-        for weak in EnhancedResumeNLP.WEAK_WORDS:
-            if weak in text_lower:
-                found_weak.append(weak)
-
-        return found_weak
-
-    @staticmethod
-    def suggest_improvements(text):
-        """Suggest improvements for resume text"""
-        suggestions = []
-
-        if not text:
-            return suggestions
-
-        # Check for weak language
-        weak_words = EnhancedResumeNLP.detect_weak_language(text)
-        if weak_words:
-            suggestions.append(f"Avoid passive phrases: {', '.join(weak_words)}")
-
-        # Check for quantification
-        has_numbers = bool(re.search(r"\d+", text))
-        if not has_numbers:
-            suggestions.append("Add metrics or numbers to quantify your impact")
-
-        # Check length
-        if len(text.split()) < 5:
-            suggestions.append("Provide more detail about your achievements")
-        elif len(text.split()) > 30:
-            suggestions.append("Consider making this more concise")
-
-        # Check for action verb
-        words = text.split()
-        if words:
-            first_word = words[0]
-            all_verbs = [
-                v for verbs in EnhancedResumeNLP.ACTION_VERBS.values() for v in verbs
-            ]
-            if first_word not in all_verbs:
-                suggestions.append(f"Start with an action verb (e.g., {all_verbs[0]})")
-
-        return suggestions
-
-    @staticmethod
-    def extract_skills_from_text(text):
-        """Extract potential skills from text"""
-        if not text:
-            return []
-
-        text_lower = text.lower()
-        found_skills = []
-
-        # Check for industry keywords
-        for industry, keywords in EnhancedResumeNLP.INDUSTRY_KEYWORDS.items():
-            for keyword in keywords:
-                if keyword in text_lower:
-                    found_skills.append(keyword)
-
-        return list(set(found_skills))
+    """Form helpers for the guide; resume analysis lives in ``SuggestionEngine``"""
 
     @staticmethod
     def format_bullet_points(text):
@@ -257,75 +33,6 @@ class EnhancedResumeNLP:
         clean_phone = re.sub(r"[\s\-\(\)]", "", phone)
         return len(clean_phone) >= 10
 
-    @staticmethod
-    def analyze_resume_strength(resume_data):
-        """Analyze overall resume strength"""
-        score = 0
-        feedback = []
-
-        # Check completeness (max 40 points)
-        if resume_data.get("name"):
-            score += 5
-        if resume_data.get("email"):
-            score += 5
-        if resume_data.get("summary"):
-            score += 10
-        else:
-            feedback.append("Add a professional summary")
-
-        if resume_data.get("education"):
-            score += 10
-        else:
-            feedback.append("Add education information")
-
-        if resume_data.get("experience"):
-            score += 10
-        else:
-            feedback.append("Add work experience")
-
-        # Check content quality (max 30 points)
-        total_highlights = 0
-        if resume_data.get("experience"):
-            for exp in resume_data["experience"]:
-                highlights = exp.get("highlights", "")
-                if highlights:
-                    total_highlights += len(highlights.split("\n"))
-
-        if total_highlights >= 5:
-            score += 15
-        elif total_highlights > 0:
-            score += 10
-            feedback.append("Add more achievements in your experience")
-        else:
-            feedback.append("Add specific achievements and responsibilities")
-
-        # Check for quantified achievements (max 15 points)
-        all_text = str(resume_data)
-        numbers_count = len(re.findall(r"\d+%|\d+x|\$\d+|\d+ [a-zA-Z]+", all_text))
-        if numbers_count >= 3:
-            score += 15
-        elif numbers_count > 0:
-            score += 10
-            feedback.append("Add more quantified achievements (numbers, percentages)")
-        else:
-            feedback.append("Include metrics to quantify your impact")
-
-        # Check for skills (max 15 points)
-        if resume_data.get("skills"):
-            num_skills = sum(
-                len(s.get("items", "").split(",")) for s in resume_data["skills"]
-            )
-            if num_skills >= 8:
-                score += 15
-            elif num_skills >= 4:
-                score += 10
-            else:
-                feedback.append("Add more relevant skills")
-        else:
-            feedback.append("Add a skills section")
-
-        return score, feedback
-
 
 def create_rendercv_yaml(data):
     """Create RenderCV compatible YAML structure"""
@@ -424,29 +131,9 @@ def create_rendercv_yaml(data):
     return cv_data
 
 
-def generate_resume(yaml_data, output_name="resume"):
-    """Generate PDF resume using RenderCV"""
-
-    yaml_file = f"{output_name}.yaml"
-    with open(yaml_file, "w") as f:
-        yaml.dump(yaml_data, f, default_flow_style=False, sort_keys=False)
-
-    try:
-        result = subprocess.run(
-            ["rendercv", "render", yaml_file],
-            capture_output=True,
-            text=True,
-            cwd="/home/claude",
-        )
-
-        pdf_path = f"/home/claude/rendercv_output/{output_name}/{output_name}.pdf"
-        if os.path.exists(pdf_path):
-            return pdf_path, None
-        else:
-            return None, f"PDF generation failed: {result.stderr}"
-
-    except Exception as e:
-        return None, str(e)
+def generate_resume(yaml_data):
+    """Generate PDF resume bytes using the pre-warmed RenderCV worker pool"""
+    return RenderCVPool.shared().render(yaml_data)
 
 
 def init_session_state():
@@ -460,6 +147,9 @@ def init_session_state():
         st.session_state.skill_categories = ["Technical Skills"]
     if "show_ai_suggestions" not in st.session_state:
         st.session_state.show_ai_suggestions = True
+    if "inline_suggestions" not in st.session_state:
+        st.session_state.inline_suggestions = InlineSuggestions()
+    st.session_state.inline_suggestions.start()
 
 
 def main():
@@ -468,6 +158,7 @@ def main():
     )
 
     init_session_state()
+    RenderCVPool.shared()  # Start warming render workers before the first click
 
     st.title("🤖 AI-Powered Resume Generator Pro")
     st.markdown(
@@ -554,7 +245,11 @@ def main():
 
         # AI Suggestions for Summary
         if st.session_state.show_ai_suggestions and summary:
-            suggestions = EnhancedResumeNLP.suggest_improvements(summary)
+            suggestions, is_stale = st.session_state.inline_suggestions.suggest(
+                "summary", summary, lambda text: SuggestionEngine.analyze_field("summary", text)
+            )
+            if is_stale:
+                StateManager.refresh_stale_suggestions()
             if suggestions:
                 st.info(
                     "💡 **AI Suggestions:**\n"
@@ -695,22 +390,15 @@ def main():
 
                 # AI Suggestions for Experience
                 if st.session_state.show_ai_suggestions and highlights:
-                    weak_words = EnhancedResumeNLP.detect_weak_language(highlights)
-                    if weak_words:
-                        st.warning(f"⚠️ Avoid passive language: {', '.join(weak_words)}")
-
-                    # Check for quantification
-                    if not re.search(r"\d+", highlights):
-                        st.info(
-                            "💡 Tip: Add numbers or metrics to quantify your impact"
-                        )
-
-                    # Suggest action verbs
-                    bullet_points = highlights.split("\n")
-                    for bullet in bullet_points[:2]:  # Check first 2 bullets
-                        suggestions = EnhancedResumeNLP.suggest_improvements(bullet)
-                        if suggestions:
-                            st.info(f"💡 For '{bullet[:30]}...': " + suggestions[0])
+                    tips, is_stale = st.session_state.inline_suggestions.suggest(
+                        f"experience_{i}",
+                        highlights,
+                        lambda text: SuggestionEngine.analyze_field("highlights", text),
+                    )
+                    if is_stale:
+                        StateManager.refresh_stale_suggestions()
+                    for tip in tips or []:
+                        st.info(f"💡 {tip}")
 
                 if company and position:
                     experience_list.append(
@@ -842,7 +530,8 @@ def main():
         st.header("📊 Resume Strength Analysis")
 
         if st.button("🔍 Analyze Resume", type="primary"):
-            score, feedback = EnhancedResumeNLP.analyze_resume_strength(resume_data)
+            score, findings = SuggestionEngine.overall_findings(resume_data)
+            feedback = [f.message for f in findings if f.severity != PASS]
 
             # Display score
             col1, col2, col3 = st.columns([2, 1, 2])
@@ -899,8 +588,7 @@ def main():
             with col2:
                 st.markdown("**Content Quality:**")
                 # Count quantified achievements
-                all_text = str(resume_data)
-                numbers = len(re.findall(r"\d+%|\d+x|\$\d+|\d+ [a-zA-Z]+", all_text))
+                numbers = SuggestionEngine.resume_totals(resume_data).metrics
                 st.markdown(f"📊 Quantified achievements: {numbers}")
 
                 # Count total skills
@@ -932,18 +620,17 @@ def main():
         else:
             with st.spinner("🔄 Generating your professional resume..."):
                 yaml_data = create_rendercv_yaml(resume_data)
-                pdf_path, error = generate_resume(yaml_data, "my_resume")
+                pdf_bytes, error = generate_resume(yaml_data)
 
-                if pdf_path:
+                if pdf_bytes:
                     st.success("✅ Resume generated successfully!")
 
-                    with open(pdf_path, "rb") as f:
-                        st.download_button(
-                            label="📥 Download Resume (PDF)",
-                            data=f,
-                            file_name=f"{resume_data['name'].replace(' ', '_')}_Resume.pdf",
-                            mime="application/pdf",
-                        )
+                    st.download_button(
+                        label="📥 Download Resume (PDF)",
+                        data=pdf_bytes,
+                        file_name=f"{resume_data['name'].replace(' ', '_')}_Resume.pdf",
+                        mime="application/pdf",
+                    )
 
                     with st.expander("📄 View YAML Configuration"):
                         st.code(
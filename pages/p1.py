@@ -1,6 +1,7 @@
 import streamlit as st
 from core.validator import ResumeValidator, PersonalInfo
 from core.smanager import StateManager
+from core.findings import Report
 from core.suggestions import SuggestionEngine
 
 StateManager.initialize()
@@ -33,6 +34,9 @@ summary = st.text_area(
     height=120,
     placeholder="A brief overview of your professional background and key strengths..."
 )
+StateManager.show_inline_suggestions(
+    "summary", summary, lambda text: SuggestionEngine.analyze_field("summary", text)
+)
 
 st.write("")
 
@@ -87,8 +91,8 @@ with col_sug:
             "website": website,
             "summary": summary,
         }
-        suggestions_md = SuggestionEngine.analyze_personal_info(current_data)
-        StateManager.show_suggestions(suggestions_md)
+        findings = SuggestionEngine.personal_info_findings(current_data)
+        StateManager.show_suggestions(Report("personal", tuple(findings)))
 
 with col_next:
     if st.button("Next :material/arrow_right_alt:", use_container_width=True, type="primary"):
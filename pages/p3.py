@@ -1,6 +1,7 @@
 import streamlit as st
 from core.smanager import StateManager
 from core.validator import ResumeValidator
+from core.findings import Report
 from core.suggestions import SuggestionEngine
 from datetime import date, datetime
 
@@ -110,6 +111,9 @@ for i in range(st.session_state.experience_count):
             placeholder="• Led team of 5 engineers\n• Increased system performance by 40%\n• Developed microservices architecture",
             height=150
         )
+        StateManager.show_inline_suggestions(
+            f"experience_{i}", highlights, lambda text: SuggestionEngine.analyze_field("highlights", text)
+        )
 
         experience_entries.append({
             "company": company,
@@ -130,8 +134,8 @@ with col1:
 
 with col2:
     if st.button(":material/lightbulb: Get Suggestions", use_container_width=True, type="secondary"):
-        suggestions_md = SuggestionEngine.analyze_experience(experience_entries)
-        StateManager.show_suggestions(suggestions_md)
+        findings = SuggestionEngine.experience_findings(experience_entries)
+        StateManager.show_suggestions(Report("experience", tuple(findings), experience_entries))
 
 with col3:
     if st.button("Next :material/arrow_right_alt:", use_container_width=True, type="primary"):
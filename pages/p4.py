@@ -1,6 +1,7 @@
 import streamlit as st
 from core.smanager import StateManager
 from core.validator import ResumeValidator
+from core.findings import Report
 from core.suggestions import SuggestionEngine
 from datetime import date, datetime
 
@@ -120,8 +121,8 @@ with col1:
 
 with col2:
     if st.button(":material/lightbulb: Get Suggestions", use_container_width=True, type="secondary"):
-        suggestions_md = SuggestionEngine.analyze_projects(project_entries)
-        StateManager.show_suggestions(suggestions_md)
+        findings = SuggestionEngine.project_findings(project_entries)
+        StateManager.show_suggestions(Report("projects", tuple(findings), project_entries))
 
 with col3:
     if st.button("Next :material/arrow_right_alt:", use_container_width=True, type="primary"):
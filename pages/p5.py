@@ -1,9 +1,17 @@
 import streamlit as st
 from core.smanager import StateManager
 from core.generator import Generator
+from core.jobmatch import match_resume
+from core.findings import Report
 from core.suggestions import SuggestionEngine
-import os
+from core.themes import ThemeRegistry
+from core import jobs
+from core.jobs import QueueFull, preview_queue, render_queue
+from core.preview import LivePreview
+from core.profiling import RenderProfile
+from core.rules import RuleEngine
 from datetime import datetime
+import copy
 
 StateManager.initialize()
 st.set_page_config(page_title="Resume Generator - Final Review", layout="wide")
@@ -30,6 +38,35 @@ st.markdown(
     unsafe_allow_html=True,
 )
 
+
+@st.fragment(run_every=0.5)
+def render_job_status(job_id):
+    """Polls a background render until it finishes, then reruns the page."""
+    if render_queue.status(job_id) not in (jobs.PENDING, jobs.RUNNING):
+        st.rerun()
+
+    st.info(":material/hourglass_top: Crafting your professional resume...")
+    if st.button(":material/cancel: Cancel", key="cancel_render", use_container_width=True):
+        render_queue.cancel(job_id)
+        st.session_state.pop("render_job", None)
+        st.rerun()
+
+
+@st.fragment(run_every=1)
+def live_preview(data, theme, fit_pages=None):
+    """Shows a debounced first-page preview that refreshes in the background."""
+    if "live_preview" not in st.session_state:
+        st.session_state.live_preview = LivePreview(preview_queue)
+    image, is_stale = st.session_state.live_preview.update(data, theme, fit_pages)
+
+    if image is not None:
+        st.image(image, use_container_width=True)
+    if is_stale:
+        st.caption(":material/autorenew: Updating preview...")
+    elif st.session_state.live_preview.error:
+        st.caption(f":material/error: {st.session_state.live_preview.error}")
+
+
 StateManager.render_progress_bar(4)
 
 st.title("✨ Custom Sections & Final Review")
@@ -97,6 +134,27 @@ for i in range(st.session_state.custom_count):
 
 col1 = st.columns(1)[0]
 
+col_left, col_center, col_right = st.columns([1, 2, 1])
+with col_center:
+    theme = st.selectbox(
+        "Resume Theme",
+        ThemeRegistry.names(),
+        key="resume_theme",
+        format_func=str.title,
+    )
+    fit_one_page = st.checkbox(
+        "Fit to one page",
+        key="resume_fit_one_page",
+        help="Shrinks fonts and spacing slightly so the resume fits on a single page.",
+    )
+
+    with st.expander(":material/preview: Live Preview", expanded=True):
+        live_preview(
+            {**st.session_state.form_data, "custom_sections": custom_sections_data},
+            theme,
+            fit_pages=1 if fit_one_page else None,
+        )
+
 # Center the generate button with better prominence
 col_left, col_center, col_right = st.columns([1, 2, 1])
 with col_center:
@@ -105,8 +163,28 @@ with col_center:
     ):
         analysis_data = st.session_state.form_data.copy()
         analysis_data["custom_sections"] = custom_sections_data
-        score, feedback = SuggestionEngine.analyze_overall_resume(analysis_data)
-        StateManager.show_suggestions(feedback)
+        score, findings = SuggestionEngine.overall_findings(analysis_data)
+        StateManager.show_suggestions(Report("overall", tuple(findings), score=score))
+
+    with st.expander(":material/target: Match a Job Description"):
+        job_description = st.text_area(
+            "Job description",
+            key="job_description",
+            height=150,
+            placeholder="Paste the job posting here to see how well your resume matches it.",
+        )
+        if job_description.strip():
+            job_match = match_resume(
+                {**st.session_state.form_data, "custom_sections": custom_sections_data},
+                job_description,
+            )
+            st.metric("Match score", f"{job_match.score}/100")
+            if job_match.missing:
+                st.markdown(
+                    "**Missing keywords:** " + ", ".join(f"`{term}`" for term in job_match.missing)
+                )
+            if job_match.matched:
+                st.caption("Already covered: " + ", ".join(job_match.matched))
 
 # Center the generate button with better prominence
 col_left, col_center, col_right = st.columns([1, 2, 1])
@@ -114,25 +192,69 @@ col_left, col_center, col_right = st.columns([1, 2, 1])
 with col_center:
     st.markdown('<div class="big-button">', unsafe_allow_html=True)
     if st.button(":material/rocket_launch: Generate PDF Resume", use_container_width=True, type="primary"):
-        with st.spinner("✨ Crafting your professional resume..."):
-            st.session_state.form_data["custom_sections"] = custom_sections_data
-            pdf_path, error = Generator.generate_pdf(st.session_state.form_data)
-
-            if error:
-                st.error(f":material/error: Generation failed: {error}")
-            elif pdf_path and os.path.exists(pdf_path):
-                st.success(":material/check_circle: Resume Generated Successfully!")
-
-                with open(pdf_path, "rb") as f:
-                    pdf_bytes = f.read()
-
-                st.write("")  
-                st.download_button(
-                    label=":material/download: Download PDF",
-                    data=pdf_bytes,
-                    file_name=f"Resume_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf",
-                    mime="application/pdf",
+        st.session_state.form_data["custom_sections"] = custom_sections_data
+        profile = RenderProfile()
+        try:
+            st.session_state.render_job = render_queue.submit(
+                Generator.generate_pdf,
+                copy.deepcopy(st.session_state.form_data),
+                theme=theme,
+                fit_pages=1 if fit_one_page else None,
+                profile=profile,
+            )
+            st.session_state.render_profile = profile
+            st.session_state.pop("render_result", None)
+        except QueueFull:
+            st.warning(
+                ":material/hourglass_top: The server is busy rendering other resumes. Please try again in a moment."
+            )
+
+    job_id = st.session_state.get("render_job")
+    status = render_queue.status(job_id) if job_id else None
+
+    if status in (jobs.PENDING, jobs.RUNNING):
+        render_job_status(job_id)
+    elif status == jobs.DONE:
+        st.session_state.render_result = render_queue.result(job_id)
+        del st.session_state.render_job
+    elif status == jobs.FAILED:
+        try:
+            render_queue.result(job_id)
+        except Exception as e:
+            st.session_state.render_result = (None, str(e))
+        del st.session_state.render_job
+    elif status is not None:
+        del st.session_state.render_job
+
+    if "render_result" in st.session_state:
+        pdf_bytes, error = st.session_state.render_result
+        if error:
+            st.error(f":material/error: Generation failed: {error}")
+        elif pdf_bytes:
+            st.success(":material/check_circle: Resume Generated Successfully!")
+
+            st.write("")  
+            st.download_button(
+                label=":material/download: Download PDF",
+                data=pdf_bytes,
+                file_name=f"Resume_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf",
+                mime="application/pdf",
+                use_container_width=True,
+                type="primary",
+            )
+
+        # Append ?debug=1 to the URL to see where the render time went
+        profile = st.session_state.get("render_profile")
+        if profile is not None and st.query_params.get("debug"):
+            with st.expander(":material/speed: Render Profile"):
+                st.caption(f"Total {profile.total_ms:.1f} ms, cache {profile.info.get('cache')}")
+                st.dataframe(
+                    [{"stage": name, **entry} for name, entry in profile.as_dict()["stages"].items()],
                     use_container_width=True,
-                    type="primary",
+                    hide_index=True,
                 )
+
+    if st.query_params.get("debug"):
+        with st.expander(":material/rule: Suggestion Rule Costs"):
+            st.dataframe(RuleEngine.rule_stats(), use_container_width=True, hide_index=True)
     st.markdown("</div>", unsafe_allow_html=True)